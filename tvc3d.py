@@ -12,6 +12,18 @@ import math
 import numpy as np
 import matplotlib.pyplot as plt
 
+try:
+    from numba import njit
+    HAVE_NUMBA = True
+except ImportError:
+    # numba is optional: without it the kernels below run as plain Python
+    HAVE_NUMBA = False
+
+    def njit(*args, **kwargs):
+        if len(args) == 1 and callable(args[0]):
+            return args[0]
+        return lambda f: f
+
 g0 = 9.80665
 
 
@@ -38,6 +50,16 @@ def quat_rotate(q, v):
     return quat_mul(quat_mul(q, qv), quat_conj(q))[1:]
 
 
+def quat_to_mat(q):
+    # rotation matrix of a unit quaternion: quat_to_mat(q) @ v == quat_rotate(q, v)
+    w, x, y, z = q
+    return np.array([
+        [1.0 - 2.0*(y*y + z*z), 2.0*(x*y - z*w), 2.0*(x*z + y*w)],
+        [2.0*(x*y + z*w), 1.0 - 2.0*(x*x + z*z), 2.0*(y*z - x*w)],
+        [2.0*(x*z - y*w), 2.0*(y*z + x*w), 1.0 - 2.0*(x*x + y*y)],
+    ])
+
+
 def quat_to_euler(q):
     # returns roll, pitch, yaw (rad)
     w, x, y, z = q
@@ -56,6 +78,130 @@ def quat_to_euler(q):
     return roll, pitch, yaw
 
 
+@njit(cache=True, fastmath=True, error_model='numpy')
+def quat_normalize_inplace(q):
+    # scale a 4-element quaternion (or view) to unit length in place: one sqrt, no temporaries
+    inv = 1.0 / math.sqrt(q[0]*q[0] + q[1]*q[1] + q[2]*q[2] + q[3]*q[3])
+    q[0] *= inv
+    q[1] *= inv
+    q[2] *= inv
+    q[3] *= inv
+
+
+@njit(cache=True, fastmath=True, error_model='numpy')
+def _dynamics_nb(state, gx, gy, T, mdot, r_gimbal, I, Iinv, k_drag):
+    # scalar-unrolled TVC3DSim.dynamics for the JIT kernel; k_drag = 0.5*rho*Cd*A
+    vx, vy, vz = state[3], state[4], state[5]
+    qw, qx, qy, qz = state[6], state[7], state[8], state[9]
+    wx, wy, wz = state[10], state[11], state[12]
+    mass = state[13]
+
+    # gimballed thrust in body frame
+    tbx = -math.sin(gx) * T
+    tby = math.sin(gy) * T
+    tbz = math.cos(gx) * math.cos(gy) * T
+
+    # rotate thrust to inertial, expanded q * [0; tb] * conj(q) like quat_rotate
+    # (RK4 stages see slightly non-unit quaternions, so keep the sandwich form)
+    s = qw*qw - (qx*qx + qy*qy + qz*qz)
+    udt = 2.0 * (qx*tbx + qy*tby + qz*tbz)
+    fx = s*tbx + udt*qx + 2.0*qw*(qy*tbz - qz*tby)
+    fy = s*tby + udt*qy + 2.0*qw*(qz*tbx - qx*tbz)
+    fz = s*tbz + udt*qz + 2.0*qw*(qx*tby - qy*tbx)
+
+    # gravity + quadratic drag
+    fz -= mass * g0
+    vnorm = math.sqrt(vx*vx + vy*vy + vz*vz)
+    if vnorm > 1e-6:
+        kd = k_drag * vnorm
+        fx -= kd * vx
+        fy -= kd * vy
+        fz -= kd * vz
+
+    # torque in body frame: r_gimbal x thrust_body, minus gyroscopic term omega x (I omega)
+    rx, ry, rz = r_gimbal[0], r_gimbal[1], r_gimbal[2]
+    hx = I[0, 0]*wx + I[0, 1]*wy + I[0, 2]*wz
+    hy = I[1, 0]*wx + I[1, 1]*wy + I[1, 2]*wz
+    hz = I[2, 0]*wx + I[2, 1]*wy + I[2, 2]*wz
+    mx = (ry*tbz - rz*tby) - (wy*hz - wz*hy)
+    my = (rz*tbx - rx*tbz) - (wz*hx - wx*hz)
+    mz = (rx*tby - ry*tbx) - (wx*hy - wy*hx)
+
+    d = np.empty(14)
+    d[0] = vx
+    d[1] = vy
+    d[2] = vz
+    d[3] = fx / mass
+    d[4] = fy / mass
+    d[5] = fz / mass
+    # q_dot = 0.5 * q * [0; omega]
+    d[6] = 0.5 * (-qx*wx - qy*wy - qz*wz)
+    d[7] = 0.5 * (qw*wx + qy*wz - qz*wy)
+    d[8] = 0.5 * (qw*wy - qx*wz + qz*wx)
+    d[9] = 0.5 * (qw*wz + qx*wy - qy*wx)
+    d[10] = Iinv[0, 0]*mx + Iinv[0, 1]*my + Iinv[0, 2]*mz
+    d[11] = Iinv[1, 0]*mx + Iinv[1, 1]*my + Iinv[1, 2]*mz
+    d[12] = Iinv[2, 0]*mx + Iinv[2, 1]*my + Iinv[2, 2]*mz
+    d[13] = mdot
+    return d
+
+
+@njit(cache=True, fastmath=True, error_model='numpy')
+def rk4_step_nb(state, gx, gy, dt, T, mdot, r_gimbal, I, Iinv, k_drag):
+    # one RK4 step of the rigid-body dynamics; the trailing arguments come from TVC3DSim.kernel_params()
+    k1 = _dynamics_nb(state, gx, gy, T, mdot, r_gimbal, I, Iinv, k_drag)
+    k2 = _dynamics_nb(state + 0.5*dt*k1, gx, gy, T, mdot, r_gimbal, I, Iinv, k_drag)
+    k3 = _dynamics_nb(state + 0.5*dt*k2, gx, gy, T, mdot, r_gimbal, I, Iinv, k_drag)
+    k4 = _dynamics_nb(state + dt*k3, gx, gy, T, mdot, r_gimbal, I, Iinv, k_drag)
+    new = state + (dt/6.0)*(k1 + 2.0*k2 + 2.0*k3 + k4)
+    # renormalize quaternion
+    quat_normalize_inplace(new[6:10])
+    return new
+
+
+@njit(cache=True, fastmath=True, error_model='numpy')
+def advance_nb(state, gx, gy, dt, out, prev_pos, stats, T, mdot, r_gimbal, I, Iinv, k_drag):
+    # run len(out) RK4 steps from state, writing each new state into a row of out.
+    # stats = [max altitude, max speed, path length] and prev_pos are updated in place.
+    # A hard ground impact (alt <= 0.1 m above 5 m/s) ends the batch early; a soft
+    # touchdown is clamped to the ground. Returns (steps taken, impact flag).
+    s = state
+    for i in range(out.shape[0]):
+        s = rk4_step_nb(s, gx, gy, dt, T, mdot, r_gimbal, I, Iinv, k_drag)
+        alt = s[2]
+        vel = math.sqrt(s[3]*s[3] + s[4]*s[4] + s[5]*s[5])
+        stats[0] = max(stats[0], alt)
+        stats[1] = max(stats[1], vel)
+        dx = s[0] - prev_pos[0]
+        dy = s[1] - prev_pos[1]
+        dz = s[2] - prev_pos[2]
+        stats[2] += math.sqrt(dx*dx + dy*dy + dz*dz)
+        prev_pos[0] = s[0]
+        prev_pos[1] = s[1]
+        prev_pos[2] = s[2]
+        if alt <= 0.1 and vel > 5.0:
+            out[i] = s
+            return i + 1, True
+        if alt <= 0.0:
+            s[2] = 0.0
+            s[3] = 0.0
+            s[4] = 0.0
+            s[5] = 0.0
+        out[i] = s
+    return out.shape[0], False
+
+
+def warmup_kernels():
+    # compile (or load from cache) the JIT kernels with the argument types the sims use
+    sim = TVC3DSim()
+    state = np.zeros(14)
+    state[6] = 1.0
+    state[13] = sim.mass0
+    rk4_step_nb(state, 0.0, 0.0, 0.01, *sim.kernel_params())
+    advance_nb(state, 0.0, 0.0, 0.01, np.empty((1, 14)), np.zeros(3), np.zeros(3), *sim.kernel_params())
+    quat_normalize_inplace(state[6:10])
+
+
 class TVC3DSim:
     def __init__(self,
                  mass0=100.0,
@@ -136,15 +282,14 @@ class TVC3DSim:
 
         return deriv
 
+    def kernel_params(self):
+        # current vehicle parameters in the order rk4_step_nb expects them;
+        # read on every call because staging mutates T, mdot and I in place
+        return (float(self.T), float(self.mdot), self.r_gimbal, self.I, self.Iinv,
+                0.5 * self.rho * self.Cd * self.A)
+
     def rk4_step(self, state, gimbal, dt):
-        k1 = self.dynamics(state, gimbal)
-        k2 = self.dynamics(state + 0.5*dt*k1, gimbal)
-        k3 = self.dynamics(state + 0.5*dt*k2, gimbal)
-        k4 = self.dynamics(state + dt*k3, gimbal)
-        new = state + (dt/6.0)*(k1 + 2*k2 + 2*k3 + k4)
-        # renormalize quaternion
-        new[6:10] /= np.linalg.norm(new[6:10])
-        return new
+        return rk4_step_nb(state, float(gimbal[0]), float(gimbal[1]), dt, *self.kernel_params())
 
 
 def attitude_controller_pd(quat, omega, Kp=50.0, Kd=20.0):
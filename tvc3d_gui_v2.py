@@ -4,65 +4,236 @@ PyQt5-based TVC GUI v2 — embeds a Matplotlib 3D canvas and a right-side contro
 
 Run: python3 tvc3d_gui_v2.py
 """
+import os
 import sys
 import math
-import csv
+import time
+from functools import lru_cache
 import numpy as np
 from PyQt5 import QtWidgets, QtCore, QtGui
 from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
 from matplotlib.figure import Figure
+from matplotlib.colors import to_hex
 from matplotlib.lines import Line2D
-from mpl_toolkits.mplot3d.art3d import Poly3DCollection
-
-from tvc3d import TVC3DSim, quat_to_euler, quat_rotate, torque_to_gimbal, attitude_controller_pid
-
+from matplotlib.collections import Collection
+from matplotlib.patches import Patch
+from matplotlib.ticker import NullLocator
+from mpl_toolkits.mplot3d.art3d import Poly3DCollection, Line3DCollection
+
+from tvc3d import TVC3DSim, quat_to_euler, quat_to_mat, torque_to_gimbal, attitude_controller_pid, advance_nb, warmup_kernels, HAVE_NUMBA
+
+try:
+    import pyqtgraph.opengl as gl
+    HAVE_PYQTGRAPH = True
+except ImportError:
+    HAVE_PYQTGRAPH = False
+
+# main viewport backend: Matplotlib by default; the GPU-rendered pyqtgraph view is opt-in
+# (TVC_GL_VIEWPORT=1) because a machine without a working OpenGL context only gets a blank view
+USE_GL_VIEWPORT = HAVE_PYQTGRAPH and os.environ.get('TVC_GL_VIEWPORT', '0') not in ('', '0')
+
+
+_INV255 = 1.0 / 255.0
+
+# reset attitude: 5° pitch about body y (already unit length), and a zeroed state to copy from
+_Q0_PITCH5 = np.array([math.cos(math.radians(5.0)/2), 0.0, math.sin(math.radians(5.0)/2), 0.0])
+_STATE_TEMPLATE = np.zeros(14)
+
+# gimbal slider label text for every position (tenths of a degree, ±600), built once
+_GIMBAL_LABELS = tuple(f"{v/10.0:.1f}°" for v in range(-600, 601))
+
+# run-log columns for the data table and CSV exports (the quaternion is stored scalar-first)
+_LOG_COLUMNS = ['t', 'x', 'y', 'z', 'vx', 'vy', 'vz', 'qw', 'qx', 'qy', 'qz', 'mass']
+
+# arc parameter 0..1 for the predicted-thrust gimbal arc (50 segments)
+_ARC_T = np.linspace(0.0, 1.0, 51)
+
+# unit circle for the ground scale rings and -1..1 stations for the ground grid lines
+_RING_THETAS = np.linspace(0, 2*math.pi, 120)
+_RING_COS = np.cos(_RING_THETAS)
+_RING_SIN = np.sin(_RING_THETAS)
+_RING_ZEROS = np.zeros(120)
+# the same circle as (120, 3) float32 vertices for the GL view
+_RING_UNIT32 = np.column_stack((_RING_COS, _RING_SIN, _RING_ZEROS)).astype(np.float32)
+_GRID_UNIT = np.linspace(-1.0, 1.0, 9)
+
+
+# application stylesheets, one per theme; set once on the main window and cascaded
+# to every child, so individual widgets are styled through objectName selectors here
+_COMMON_QSS = """
+QScrollArea { border: none; }
+QHeaderView::section { padding: 4px; }
+QGroupBox#hud_box { font-weight: 700; margin-top: 4px; margin-bottom: 2px; padding-top: 12px; }
+QLabel#hud_stats { font-size: 9pt; color: #64b5f6; }
+QLabel#hud_flight { font-size: 9pt; color: #81c784; }
+QLabel#preset_label { font-weight: bold; }
+AnimatedButton:hover { border: 1px solid rgba(255,140,60,0.55); }
+"""
 
+# teal-accent dark theme — flat & sophisticated
+_DARK_QSS = """
+QWidget { background: #0f1113; color: #e6eef8; }
+QPushButton {
+    background: #1a3a52;
+    color: #64b5f6;
+    border: 1px solid rgba(66,165,245,0.3);
+    border-radius: 6px;
+    padding: 10px 14px;
+    font-weight: 600;
+    font-size: 12px;
+}
+QPushButton:hover {
+    background: #1f4a66;
+    border: 1px solid rgba(100,181,246,0.5);
+    color: #90caf9;
+}
+QPushButton:pressed {
+    background: #0d2435;
+    border: 1px solid rgba(100,181,246,0.6);
+}
+QGroupBox {
+    color: #e6eef8;
+    font-weight: 700;
+    border: 1px solid rgba(66,165,245,0.15);
+    border-radius: 6px;
+    margin-top: 10px;
+    padding-top: 10px;
+}
+QLabel { color: #e6eef8; }
+QTextEdit { background: #0f1113; color: #e6eef8; border: 1px solid rgba(66,165,245,0.15); }
+QCheckBox { color: #e6eef8; }
+QComboBox { color: #e6eef8; background: #1a1a1e; border: 1px solid rgba(66,165,245,0.15); }
+QSlider::groove:horizontal { height: 6px; background: #1a1a1e; border-radius: 3px; }
+QSlider::sub-page:horizontal { background: #42a5f5; border-radius: 3px; }
+QSlider::handle:horizontal { background: #64b5f6; width: 14px; margin: -4px 0; border-radius: 7px; border: 1px solid rgba(66,165,245,0.4); }
+QSlider::add-page:horizontal { background: #222; border-radius: 3px; }
+""" + _COMMON_QSS
+
+# light theme: teal accents, flat design
+_LIGHT_QSS = """
+QWidget { background: #f5f9fb; color: #1a4d6d; }
+QPushButton {
+    background: #d4ecf7;
+    color: #1a4d6d;
+    border: 1px solid rgba(66,165,245,0.3);
+    border-radius: 6px;
+    padding: 10px 14px;
+    font-weight: 600;
+    font-size: 12px;
+}
+QPushButton:hover {
+    background: #c5e9f5;
+    border: 1px solid rgba(66,165,245,0.5);
+    color: #0d3d5c;
+}
+QPushButton:pressed {
+    background: #81c3f7;
+    border: 1px solid rgba(66,165,245,0.6);
+}
+QGroupBox {
+    color: #1a4d6d;
+    font-weight: 700;
+    border: 1px solid rgba(66,165,245,0.2);
+    border-radius: 6px;
+    margin-top: 10px;
+    padding-top: 10px;
+}
+QLabel { color: #1a4d6d; }
+QTextEdit { background: #fafbfc; color: #1a4d6d; border: 1px solid rgba(66,165,245,0.2); }
+QCheckBox { color: #1a4d6d; }
+QComboBox { color: #1a4d6d; background: #eef7fb; border: 1px solid rgba(66,165,245,0.2); }
+QSlider::groove:horizontal { height: 6px; background: #d4e8f3; border-radius: 3px; }
+QSlider::sub-page:horizontal { background: #2196f3; border-radius: 3px; }
+QSlider::handle:horizontal { background: #1976d2; width: 14px; margin: -4px 0; border-radius: 7px; border: 1px solid rgba(66,165,245,0.4); }
+QSlider::add-page:horizontal { background: #e3f2fd; border-radius: 3px; }
+""" + _COMMON_QSS
+
+
+@lru_cache(maxsize=128)
 def _hex_to_rgba(h, alpha=1.0):
     h = h.lstrip('#')
     lv = len(h)
-    if lv == 6:
-        r, g, b = int(h[0:2], 16), int(h[2:4], 16), int(h[4:6], 16)
-    elif lv == 3:
-        r, g, b = int(h[0]*2, 16), int(h[1]*2, 16), int(h[2]*2, 16)
-    else:
+    if lv == 3:
+        # expand shorthand '#abc' -> 'aabbcc'
+        h = ''.join(c*2 for c in h)
+    elif lv != 6:
         return (0, 0, 0, alpha)
-    return (r/255.0, g/255.0, b/255.0, alpha)
+    # single C-level decode instead of three int(..., 16) calls
+    r, g, b = bytes.fromhex(h)
+    return (r*_INV255, g*_INV255, b*_INV255, alpha)
+
+
+# scene palette resolved to RGBA once at import (traj/veh/vel are the default C0/C1/C2 colors)
+_PAL = {name: _hex_to_rgba(h) for name, h in (
+    ('traj', '#1f77b4'), ('veh', '#ff7f0e'), ('veh_edge', '#3a2a10'), ('vel', '#2ca02c'),
+    ('ring', '#ff8a00'), ('ring_label', '#ffb86b'), ('bg', '#121418'), ('legend_bg', '#1b2330'),
+)}
+
+
+def _trail_markers(path):
+    # every ~n/80-th path point, alpha ramping from the oldest (0.15) to the newest (0.9) sample
+    n = path.shape[0]
+    idx = np.arange(0, n, max(1, n // 80))
+    rgba = np.empty((idx.size, 4))
+    rgba[:] = _PAL['traj']
+    rgba[:, 3] = np.linspace(0.15, 0.9, n)[idx]
+    return path[idx], rgba
+
+
+def _norm3(v):
+    # length of a 3-vector without np.linalg.norm's dispatch overhead
+    return math.sqrt(v[0]*v[0] + v[1]*v[1] + v[2]*v[2])
+
+
+def _arrow_segments(base, direction, length, ratio=0.3):
+    # shaft + two 15° head barbs, the same glyph Axes3D.quiver draws for a unit direction
+    d = np.asarray(direction, dtype=float)
+    tip = base + length * d
+    hn = math.hypot(d[0], d[1])
+    k = np.array([d[1]/hn, -d[0]/hn, 0.0]) if hn > 0 else np.array([0.0, 1.0, 0.0])
+    kxd = np.cross(k, d)
+    c, s = math.cos(math.radians(15)), math.sin(math.radians(15))
+    head = ratio * length
+    return np.array([
+        [base, tip],
+        [tip, tip - head * (c*d + s*kxd)],
+        [tip, tip - head * (c*d - s*kxd)],
+    ])
+
+
+def _build_axis_cones():
+    # tip + three base points of the cone glyph on each body axis, in body coordinates
+    eye = np.eye(3)
+    verts = np.empty((3, 4, 3), dtype=np.float32)
+    for i in range(3):
+        e, p1, p2 = eye[i], eye[(i+1) % 3], eye[(i+2) % 3]
+        verts[i, 0] = 0.9 * e
+        for k, a in enumerate((0, 2.09, 4.18)):
+            verts[i, k+1] = (0.9 - 0.25) * e + 0.08 * (math.cos(a)*p1 + math.sin(a)*p2)
+    # three triangles per cone over its (tip, base1, base2, base3) vertices
+    faces = np.array([[4*i, 4*i + a, 4*i + b] for i in range(3) for a, b in ((1, 2), (2, 3), (3, 1))], dtype=np.int32)
+    return verts.reshape(12, 3), faces
+
+
+# body-axis cone glyph, built once: (12, 3) body-frame vertices and (9, 3) triangle indices
+_CONE_VERTS_LOCAL, _CONE_FACES = _build_axis_cones()
 
 
 class AnimatedButton(QtWidgets.QPushButton):
-    """QPushButton with a subtle drop-shadow that animates on hover."""
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
-        # create a drop shadow effect but start with zero blur
-        self._shadow = QtWidgets.QGraphicsDropShadowEffect(self)
-        # subtler orange glow for hover
-        self._shadow.setColor(QtGui.QColor(255, 140, 60, 140))
-        self._shadow.setBlurRadius(0)
-        self._shadow.setOffset(0, 1)
-        self.setGraphicsEffect(self._shadow)
-        self._blur_anim = QtCore.QPropertyAnimation(self._shadow, b'blurRadius', self)
-        self._blur_anim.setDuration(200)
-        self._blur_anim.setEasingCurve(QtCore.QEasingCurve.OutQuad)
-
-    def enterEvent(self, ev):
-        try:
-            self._blur_anim.stop()
-            self._blur_anim.setStartValue(self._shadow.blurRadius())
-            self._blur_anim.setEndValue(10)
-            self._blur_anim.start()
-        except Exception:
-            pass
-        super().enterEvent(ev)
+    """QPushButton with an orange hover glow.
+
+    The glow is the ``AnimatedButton:hover`` border rule in the application stylesheet,
+    so hovering costs a normal style repaint rather than a QGraphicsEffect rasterization.
+    """
 
-    def leaveEvent(self, ev):
+
+class JitWarmup(QtCore.QThread):
+    """Compiles the numba physics kernel off the UI thread so the first Start isn't stalled."""
+    def run(self):
         try:
-            self._blur_anim.stop()
-            self._blur_anim.setStartValue(self._shadow.blurRadius())
-            self._blur_anim.setEndValue(0)
-            self._blur_anim.start()
+            warmup_kernels()
         except Exception:
             pass
-        super().leaveEvent(ev)
 
 
 class Mpl3DCanvas(FigureCanvas):
@@ -71,14 +242,128 @@ class Mpl3DCanvas(FigureCanvas):
         self.ax = fig.add_subplot(111, projection='3d')
         # make canvas background compatible with dark theme by default
         try:
-            fig.patch.set_facecolor('#121418')
-            self.ax.set_facecolor('#121418')
+            fig.patch.set_facecolor(_PAL['bg'])
+            self.ax.set_facecolor(_PAL['bg'])
         except Exception:
             pass
         super().__init__(fig)
         self.setParent(parent)
 
 
+if HAVE_PYQTGRAPH:
+    class GL3DView(gl.GLViewWidget):
+        """OpenGL viewport; the scene lives in persistent GL items whose vertex data is replaced each frame."""
+        AXIS_COLORS = np.array([(1.0, 0.2, 0.2, 0.9), (0.2, 0.9, 0.2, 0.9), (0.2, 0.5, 0.9, 0.9)])
+
+        def __init__(self, parent=None):
+            super().__init__(parent)
+            self.setCameraPosition(distance=30, elevation=25, azimuth=-60)
+            self.grid = gl.GLGridItem()
+            self.grid.setSize(200, 200)
+            self.grid.setSpacing(10, 10)
+            self.addItem(self.grid)
+            self.traj = gl.GLLinePlotItem(pos=np.zeros((2, 3)), color=(0.12, 0.47, 0.71, 0.9), width=1.5, mode='line_strip', antialias=True)
+            self.axes = gl.GLLinePlotItem(pos=np.zeros((6, 3)), color=np.repeat(self.AXIS_COLORS, 2, axis=0), width=2.2, mode='lines')
+            self.cones = gl.GLMeshItem(vertexes=np.zeros((12, 3)), faces=_CONE_FACES,
+                                       faceColors=np.repeat(self.AXIS_COLORS, 3, axis=0), smooth=False)
+            self.vehicle = gl.GLScatterPlotItem(pos=np.zeros((1, 3)), color=(1.0, 0.5, 0.05, 1.0), size=12)
+            self.thrust = gl.GLLinePlotItem(pos=np.zeros((6, 3)), color=(1.0, 0.0, 1.0, 0.7), width=2.5, mode='lines')
+            self.vel = gl.GLLinePlotItem(pos=np.zeros((6, 3)), color=(0.17, 0.63, 0.17, 1.0), width=1.5, mode='lines')
+            self.markers = gl.GLScatterPlotItem(pos=np.zeros((1, 3)), color=_PAL['traj'], size=4)
+            self.stages = gl.GLLinePlotItem(pos=np.zeros((2, 3)), color=(0.6, 0.6, 0.6, 1.0), width=1.0, mode='lines')
+            # gimbal deflection arc and its angle label (shown with the thrust preview)
+            self.arc = gl.GLLinePlotItem(pos=np.zeros((2, 3)), color=(1.0, 0.0, 1.0, 0.95), width=4.5, mode='line_strip')
+            self.arc_label = gl.GLTextItem(text='', color='#ff00ff', font=QtGui.QFont('Helvetica', 14, QtGui.QFont.Bold))
+            # ground distance rings at 25/50/100% of the ground half-width, with labels
+            self.rings = [gl.GLLinePlotItem(pos=np.zeros((2, 3)), color=_PAL['ring'], width=1.6, mode='line_strip'),
+                          gl.GLLinePlotItem(pos=np.zeros((2, 3)), color=_PAL['ring'], width=1.6, mode='line_strip'),
+                          gl.GLLinePlotItem(pos=np.zeros((2, 3)), color=(0.6, 0.6, 0.6, 0.6), width=0.8, mode='line_strip')]
+            self.ring_labels = [gl.GLTextItem(text='', color='#ffb86b', font=QtGui.QFont('Helvetica', 9)),
+                                gl.GLTextItem(text='', color='#ffb86b', font=QtGui.QFont('Helvetica', 9)),
+                                gl.GLTextItem(text='', color='#737373', font=QtGui.QFont('Helvetica', 8))]
+            # compass: arrow along +y at the north edge of the ground, labelled N
+            self.compass = gl.GLLinePlotItem(pos=np.zeros((6, 3)), color=(0.6, 0.6, 0.6, 1.0), width=1.0, mode='lines')
+            self.compass_label = gl.GLTextItem(text='N', color='#e6eef8', font=QtGui.QFont('Helvetica', 9))
+            # translucent unit ground quad at z=0, scaled and moved by its transform each frame
+            self.ground = gl.GLMeshItem(vertexes=np.array([(-1, -1, 0), (1, -1, 0), (1, 1, 0), (-1, 1, 0)], dtype=np.float32),
+                                        faces=np.array([(0, 1, 2), (0, 2, 3)]), color=(0.5, 0.5, 0.5, 0.15),
+                                        smooth=False, glOptions='translucent')
+            for item in (self.ground, *self.rings, *self.ring_labels, self.compass, self.compass_label,
+                         self.traj, self.markers, self.axes, self.cones, self.vehicle,
+                         self.thrust, self.arc, self.arc_label, self.vel, self.stages):
+                self.addItem(item)
+            # legend overlay in the top-left corner, same entries as the Matplotlib legend
+            self.legend = QtWidgets.QLabel(self)
+            self.legend.setTextFormat(QtCore.Qt.RichText)
+            self.legend.move(8, 8)
+
+        def set_theme(self, tc):
+            # background, legend and compass colors from TVCMainWindow._set_theme_colors
+            self.setBackgroundColor(tuple(int(round(c * 255)) for c in tc['view_bg']))
+            self.compass_label.setData(color=tc['text_color'])
+            self.legend.setStyleSheet(f"background: {to_hex(tc['legend_bg'])}; color: {tc['text_color']}; padding: 4px;")
+            self.legend.setText(
+                '<span style="color:#1f77b4">&#9472;&#9472;</span> Flight path<br>'
+                '<span style="color:#ff7f0e">&#9679;</span> Vehicle<br>'
+                '<span style="color:#2ca02c">&#9472;&#9472;</span> Velocity')
+            self.legend.adjustSize()
+            self.update()
+
+        def update_scene(self, pos, R, trail, cone_verts, preview, vel_segs, stage_segs=None,
+                         win=6.0, follow=False, topdown=False, live=False):
+            # trail: (n, 3) points; *_segs: (k, 2, 3) line segments or None to hide; all float32.
+            # preview: (thrust_segs, arc_pts, label) from _thrust_preview_geometry, or None to hide.
+            # win: ground half-width; live: the sim is running, so draw the trail aliased
+            self.traj.setVisible(trail.shape[0] > 1)
+            self.markers.setVisible(trail.shape[0] > 1)
+            has_ground = trail.shape[0] > 0
+            for item in (self.ground, *self.rings, *self.ring_labels, self.compass, self.compass_label):
+                item.setVisible(has_ground)
+            if trail.shape[0] > 1:
+                self.traj.setData(pos=trail, antialias=not live)
+                pts, rgba = _trail_markers(trail)
+                self.markers.setData(pos=pts, color=rgba)
+            self.ground.resetTransform()
+            self.ground.translate(float(pos[0]), float(pos[1]), 0.0)
+            self.ground.scale(win, win, 1.0)
+            cx, cy = float(pos[0]), float(pos[1])
+            centre = np.array((cx, cy, 0.0), dtype=np.float32)
+            for r, ring, label in zip((win*0.25, win*0.5, win), self.rings, self.ring_labels):
+                ring.setData(pos=_RING_UNIT32 * np.float32(r) + centre)
+                label.setData(pos=(cx + r, cy, 0.0), text=f"{r:.0f} m")
+            north = np.array([cx, cy + win, 0.0])
+            compass = _arrow_segments(north - (0.0, 0.2 * win, 0.0), (0.0, 1.0, 0.0), 0.2 * win)
+            self.compass.setData(pos=compass.reshape(-1, 3).astype(np.float32))
+            self.compass_label.setData(pos=north + (0.0, 0.05 * win, 0.0))
+            stems = np.empty((6, 3), dtype=np.float32)
+            stems[0::2] = pos
+            stems[1::2] = pos + 0.7 * R.T
+            self.axes.setData(pos=stems)
+            self.cones.setMeshData(vertexes=cone_verts, faces=_CONE_FACES,
+                                   faceColors=np.repeat(self.AXIS_COLORS, 3, axis=0))
+            self.vehicle.setData(pos=pos.reshape(1, 3))
+            thrust_segs = None
+            for item in (self.arc, self.arc_label):
+                item.setVisible(preview is not None)
+            if preview is not None:
+                thrust_segs, arc_pts, label = preview
+                self.arc.setData(pos=arc_pts)
+                self.arc_label.setData(pos=arc_pts[len(arc_pts) // 2], text=label)
+            for item, segs in ((self.thrust, thrust_segs), (self.vel, vel_segs), (self.stages, stage_segs)):
+                item.setVisible(segs is not None)
+                if segs is not None:
+                    item.setData(pos=segs.reshape(-1, 3))
+            # keep the ground grid under the vehicle
+            self.grid.resetTransform()
+            self.grid.translate(round(pos[0] / 10.0) * 10.0, round(pos[1] / 10.0) * 10.0, 0.0)
+            if topdown:
+                self.opts['elevation'] = 90
+                self.opts['azimuth'] = -90
+            if follow or topdown:
+                self.opts['center'] = QtGui.QVector3D(float(pos[0]), float(pos[1]), float(pos[2]))
+            self.update()
+
+
 class TVCMainWindow(QtWidgets.QMainWindow):
     def __init__(self):
         super().__init__()
@@ -90,13 +375,16 @@ class TVCMainWindow(QtWidgets.QMainWindow):
         self.setCentralWidget(central)
         layout = QtWidgets.QHBoxLayout(central)
 
-        # left: matplotlib 3D canvas
-        self.canvas = Mpl3DCanvas(self, width=7, height=6)
-        # set a sensible default 3D view
-        try:
-            self.canvas.ax.view_init(elev=25, azim=-60)
-        except Exception:
-            pass
+        # left: 3D viewport (OpenGL when pyqtgraph is installed, else matplotlib)
+        if USE_GL_VIEWPORT:
+            self.canvas = GL3DView(self)
+        else:
+            self.canvas = Mpl3DCanvas(self, width=7, height=6)
+            # set a sensible default 3D view
+            try:
+                self.canvas.ax.view_init(elev=25, azim=-60)
+            except Exception:
+                pass
         layout.addWidget(self.canvas, stretch=2)
 
         # right: control panel inside a scroll area so all controls are reachable
@@ -112,7 +400,7 @@ class TVCMainWindow(QtWidgets.QMainWindow):
 
         # === HUD at top for immediate visibility ===
         hud_box = QtWidgets.QGroupBox('HUD')
-        hud_box.setStyleSheet("QGroupBox { font-weight: 700; margin-top: 4px; margin-bottom: 2px; padding-top: 12px; }")
+        hud_box.setObjectName('hud_box')
         hud_layout = QtWidgets.QVBoxLayout()
         hud_layout.setSpacing(3)
         hud_layout.setContentsMargins(4, 4, 4, 4)
@@ -121,9 +409,9 @@ class TVCMainWindow(QtWidgets.QMainWindow):
         self.hud_thr = QtWidgets.QLabel('Throttle: 100%')
         self.hud_gimb = QtWidgets.QLabel('Gimbal X: 0.0°   Gimbal Y: 0.0°')
         self.hud_stats = QtWidgets.QLabel('Max Alt: 0.0m | Max Vel: 0.0m/s')
-        self.hud_stats.setStyleSheet('QLabel { font-size: 9pt; color: #64b5f6; }')
+        self.hud_stats.setObjectName('hud_stats')
         self.hud_flight = QtWidgets.QLabel('Time: 0.0s | Distance: 0.0m')
-        self.hud_flight.setStyleSheet('QLabel { font-size: 9pt; color: #81c784; }')
+        self.hud_flight.setObjectName('hud_flight')
         # small colored legend using HTML spans
         legend_html = (
             '<div><span style="display:inline-block;width:12px;height:8px;background:#1f77b4;margin-right:6px;"></span>Flight path</div>'
@@ -176,7 +464,7 @@ class TVCMainWindow(QtWidgets.QMainWindow):
         
         # === Preset Configurations ===
         preset_label = QtWidgets.QLabel('Quick Presets:')
-        preset_label.setStyleSheet('QLabel { font-weight: bold; }')
+        preset_label.setObjectName('preset_label')
         ctrl_layout.addWidget(preset_label)
         preset_grid = QtWidgets.QGridLayout()
         preset_grid.setSpacing(4)
@@ -281,6 +569,7 @@ class TVCMainWindow(QtWidgets.QMainWindow):
         self.topdown_chk = QtWidgets.QCheckBox('Top-down (orthographic)')
         self.topdown_chk.setChecked(False)
         ctrl_layout.addWidget(self.topdown_chk)
+        self.topdown_chk.toggled.connect(self._invalidate_bg)
         self.topdown_chk.toggled.connect(self._draw_scene)
         ctrl_layout.addSpacing(8)
 
@@ -324,17 +613,45 @@ class TVCMainWindow(QtWidgets.QMainWindow):
         self.status_box.setReadOnly(True)
         self.status_box.setMaximumHeight(100)
         ctrl_layout.addWidget(self.status_box)
+        # status messages are queued and appended in one batch at most every 250 ms,
+        # so bursts of messages cost one document relayout instead of one each
+        self._status_queue = []
+        self._status_flush_timer = QtCore.QTimer(self)
+        self._status_flush_timer.setSingleShot(True)
+        self._status_flush_timer.setInterval(250)
+        self._status_flush_timer.timeout.connect(self._flush_status)
+        # HUD/status text last written per label (see _set_hud_text), and the earliest
+        # time a running sim refreshes the HUD again (10 Hz)
+        self._hud_last = {}
+        self._hud_next = 0.0
 
         # push to bottom
         ctrl_layout.addStretch()
 
         # simulator
         self.sim = TVC3DSim()
+        # full-throttle thrust; the throttle slider scales this
+        self.base_T = self.sim.T
         self.dt = 0.01  # smaller timestep for slower, more accurate movement
         self.timer = QtCore.QTimer(self)
+        self.timer.setTimerType(QtCore.Qt.PreciseTimer)
         self.timer.setInterval(int(self.dt*1000))
-        self.timer.timeout.connect(self._on_step)
+        self.timer.timeout.connect(self._on_tick)
+        # wall-clock time not yet integrated; each tick catches up by up to _max_substeps steps
+        self._sim_accum = 0.0
+        self._last_tick = 0.0
+        self._max_substeps = 10
+        # the scene is redrawn on its own ~30 Hz timer, and only when the physics has
+        # advanced since the last draw (_dirty)
+        self.draw_timer = QtCore.QTimer(self)
+        self.draw_timer.setInterval(33)
+        self.draw_timer.timeout.connect(self._on_draw_tick)
+        self._dirty = False
         self.running = False
+        self._jit_warmup = None
+        if HAVE_NUMBA:
+            self._jit_warmup = JitWarmup(self)
+            self._jit_warmup.start()
         
         # captured gimbal/throttle settings (set when Start is pressed)
         self.run_gimbal_x = 0.0  # radians
@@ -350,29 +667,66 @@ class TVCMainWindow(QtWidgets.QMainWindow):
         self.camera_target = np.array([0.0, 0.0, 0.0])
         self.camera_offset = np.array([0.0, 0.0, 0.0])
 
-        # run logging / playback
-        self.run_log_states = []
-        self.run_log_times = []
+        # run logging / playback: (t, state) rows in preallocated arrays that double on
+        # overflow; rows [_log_lo:_log_n] are the live window (older rows are trimmed).
+        # 8000 rows hold the default window (4 x 1000-point trail) with room to slide it
+        # back to the start, so a default run never reallocates.
+        self._log_cap = 8000
+        self._log_s = np.empty((self._log_cap, 14))
+        self._log_t = np.empty(self._log_cap)
+        self._log_lo = 0
+        self._log_n = 0
         self.stage_events = []
         self.playback_timer = QtCore.QTimer(self)
         self.playback_timer.setInterval(int(self.dt*1000))
         self.playback_timer.timeout.connect(self._playback_step)
         self.playback_index = 0
         self.playback_running = False
+        # whether the sim timer was running when playback paused it
+        self.was_running = False
 
         # state (same format as tvc3d)
         # Initialize pointing upward (+z): quaternion from 5° pitch tilt for visualization
         angle = math.radians(5.0)
         q0 = np.array([math.cos(angle/2), math.sin(angle/2), 0.0, 0.0])  # rotation about X axis for pitch
         self.state = np.zeros(14)
-        self.state[6:10] = q0 / np.linalg.norm(q0)  # normalize quaternion
+        self.state[6:10] = q0  # cos/sin of one half-angle: already unit length
         self.state[13] = self.sim.mass0
-        # flight path history
-        self.pos_hist = [self.state[0:3].copy()]
-
-        # plotting handles
-        self.traj = None
-        self.rocket_art = None
+        # flight path history: preallocated ring buffer sized for the longest trail
+        self._trail_buf = np.empty((self.trail_slider.maximum(), 3), dtype=np.float32)
+        self._trail_head = 0
+        self._trail_len = 0
+        self._trail_clear()
+
+        # plotting handles: artists kept across frames and updated in place,
+        # plus per-frame artists that are removed at the start of the next draw
+        self._artists = {}
+        self._frame_artists = []
+        # blitting: every data artist is 'animated' so a full canvas draw renders only the
+        # axes (panes, grid, ticks, labels, legend); that render is cached and reused while
+        # the view is unchanged, and the data artists are drawn over it
+        self._bg = None
+        self._bg_key = None
+        self._blit_pending = False
+        # while paused the blit is layered: the frame under the thrust preview is cached too,
+        # and a pending blit that only needs the preview repainted leaves _blit_full unset
+        self._preview_bg = None
+        self._blit_full = False
+        # reduced-detail axes while the sim runs (no ticks/grid, aliased trail)
+        self._live_render = False
+        self._saved_locators = None
+        # (cx, cy, win) the ground artists were last laid out for
+        self._ground_key = None
+        # scene colors for the current theme, filled in by _set_theme_colors()
+        self._theme_cache = None
+        # axes legend, built on first draw; _legend_tc is the theme colors it was styled with
+        self._legend = None
+        self._legend_tc = None
+        # attitude matrix cache for _attitude(); NaN never compares equal, so the first call builds it
+        self._R_quat = np.full(4, np.nan)
+        self._R = None
+        # body-frame thrust vector scratch for _predicted_thrust_dir
+        self._tb_scratch = np.empty(3)
 
         # connect signals
         self.start_btn.clicked.connect(self._on_start)
@@ -388,28 +742,37 @@ class TVCMainWindow(QtWidgets.QMainWindow):
         self.preset_right.clicked.connect(lambda: self._apply_preset(-400, 0, 100))
         self.preset_left.clicked.connect(lambda: self._apply_preset(400, 0, 100))
         self.preset_ascent.clicked.connect(lambda: self._apply_preset(0, 0, 100))
+        self._last_labels = (None, None, None)
         self.gx_slider.valueChanged.connect(self._update_slider_labels)
         self.gy_slider.valueChanged.connect(self._update_slider_labels)
         self.throttle_slider.valueChanged.connect(self._update_slider_labels)
         self.trail_slider.valueChanged.connect(lambda: self.trail_label.setText(str(self.trail_slider.value())))
         
-        # redraw scene when gimbal sliders change (for arrow preview and HUD update)
-        self.gx_slider.valueChanged.connect(self._draw_scene)
-        self.gy_slider.valueChanged.connect(self._draw_scene)
+        # redraw scene when gimbal sliders change (for arrow preview and HUD update).
+        # A 16 ms single-shot timer coalesces a slider drag into at most ~60 redraws/s;
+        # start() on an active timer simply restarts the window.
+        self._redraw_timer = QtCore.QTimer(self)
+        self._redraw_timer.setSingleShot(True)
+        self._redraw_timer.setInterval(16)
+        self._redraw_timer.timeout.connect(self._draw_arrow_preview)
+        self.gx_slider.valueChanged.connect(self._schedule_redraw)
+        self.gy_slider.valueChanged.connect(self._schedule_redraw)
 
         # canvas interactions: mouse wheel zoom and double-click reset
-        try:
-            self.canvas.mpl_connect('scroll_event', self._on_scroll)
-            self.canvas.mpl_connect('button_press_event', self._on_canvas_click)
-        except Exception:
-            pass
+        # (the GL view handles orbit and zoom itself)
+        if not USE_GL_VIEWPORT:
+            try:
+                self.canvas.mpl_connect('scroll_event', self._on_scroll)
+                self.canvas.mpl_connect('button_press_event', self._on_canvas_click)
+                self.canvas.mpl_connect('draw_event', self._on_canvas_draw)
+            except Exception:
+                pass
 
         # small visual polish: larger buttons, slider ticks and styles
         for s in (self.gx_slider, self.gy_slider, self.throttle_slider, self.trail_slider):
             s.setTickPosition(QtWidgets.QSlider.TicksBelow)
             s.setTickInterval(20)
 
-        self._apply_styles()
         # connect theme slider
         self.theme_slider.valueChanged.connect(self._on_theme_slider)
         # apply initial theme (dark by default)
@@ -422,8 +785,8 @@ class TVCMainWindow(QtWidgets.QMainWindow):
         self.run_finished = False
         
         # welcome message
-        self.status_box.append('🚀 Welcome to TVC Simulator! Press H for help or try Quick Presets.')
-        self.status_box.append('💡 Tip: Adjust gimbal sliders and watch the pink arrow preview!')
+        self._post_status('🚀 Welcome to TVC Simulator! Press H for help or try Quick Presets.')
+        self._post_status('💡 Tip: Adjust gimbal sliders and watch the pink arrow preview!')
         
         # flight statistics
         self.max_altitude = 0.0
@@ -432,6 +795,24 @@ class TVCMainWindow(QtWidgets.QMainWindow):
         self.total_distance = 0.0
         self.prev_pos = np.array([0.0, 0.0, 0.0])
     
+    def _post_status(self, msg):
+        self._status_queue.append(msg)
+        if not self._status_flush_timer.isActive():
+            self._status_flush_timer.start()
+
+    def _flush_status(self):
+        if self._status_queue:
+            self.status_box.append('\n'.join(self._status_queue))
+            self._status_queue.clear()
+            # the next HUD pass replaces the messages with the status text, as before
+            self._hud_last.pop(self.status_box, None)
+
+    def closeEvent(self, event):
+        # don't tear down the window while the kernel is still compiling
+        if self._jit_warmup is not None:
+            self._jit_warmup.wait()
+        super().closeEvent(event)
+
     def keyPressEvent(self, event):
         """Handle keyboard shortcuts"""
         key = event.key()
@@ -452,10 +833,16 @@ class TVCMainWindow(QtWidgets.QMainWindow):
     
     def _apply_preset(self, gx, gy, throttle):
         """Apply preset gimbal and throttle configuration"""
+        # block slider signals while setting all three so labels and the scene refresh once
+        blockers = [QtCore.QSignalBlocker(s) for s in (self.gx_slider, self.gy_slider, self.throttle_slider)]
         self.gx_slider.setValue(gx)
         self.gy_slider.setValue(gy)
         self.throttle_slider.setValue(throttle)
-        self.status_box.append(f'✓ Preset applied: Gimbal X={gx/10:.1f}° Y={gy/10:.1f}° Throttle={throttle}%')
+        for b in blockers:
+            b.unblock()
+        self._update_slider_labels()
+        self._redraw_timer.start()
+        self._post_status(f'✓ Preset applied: Gimbal X={gx/10:.1f}° Y={gy/10:.1f}° Throttle={throttle}%')
     
     def _show_help(self):
         """Show beginner help dialog"""
@@ -517,44 +904,77 @@ class TVCMainWindow(QtWidgets.QMainWindow):
         self.running = not self.running
         if self.running:
             # capture gimbal and throttle settings from sliders when starting
-            self.run_gimbal_x = math.radians(self.gx_slider.value() / 10.0)
-            self.run_gimbal_y = math.radians(self.gy_slider.value() / 10.0)
-            self.run_throttle = self.throttle_slider.value() / 100.0
             gx_deg = self.gx_slider.value() / 10.0
             gy_deg = self.gy_slider.value() / 10.0
             thr_pct = self.throttle_slider.value()
-            self.status_box.append(f'▶ RUN: Gimbal X={gx_deg:.1f}° Y={gy_deg:.1f}° Throttle={thr_pct}%')
+            self.run_gimbal_x = math.radians(gx_deg)
+            self.run_gimbal_y = math.radians(gy_deg)
+            self.run_throttle = thr_pct / 100.0
+            self._post_status(f'▶ RUN: Gimbal X={gx_deg:.1f}° Y={gy_deg:.1f}° Throttle={thr_pct}%')
             
             # beginner tip on first run
             if len(self.run_log_times) == 0:
-                self.status_box.append('💡 Tip: Watch the pink arrow - it shows thrust direction!')
+                self._post_status('💡 Tip: Watch the pink arrow - it shows thrust direction!')
             
             self.start_btn.setText('Pause')
-            self.timer.start()
+            self._start_sim_timer()
         else:
             self.start_btn.setText('Start')
             self.timer.stop()
+            # restore ticks and grid and show the paused state now rather than on the next draw tick
+            self.draw_timer.stop()
+            self._set_live_render(False)
+            self._draw_scene()
 
     def _on_step(self):
         # perform one integration step and redraw
         self._step_sim()
         self._draw_scene()
 
+    def _start_sim_timer(self):
+        self._sim_accum = 0.0
+        self._last_tick = time.perf_counter()
+        self.timer.start()
+        self.draw_timer.start()
+
+    def _on_tick(self):
+        # integrate as many dt steps as wall-clock time has passed (capped); drawing happens
+        # separately in _on_draw_tick, so a slow frame costs frame rate rather than simulation speed
+        now = time.perf_counter()
+        self._sim_accum += now - self._last_tick
+        self._last_tick = now
+        n_steps = min(int(self._sim_accum / self.dt), self._max_substeps)
+        if n_steps:
+            self._step_sim(n_steps)
+        # keep at most one tick's worth of backlog so a long stall can't snowball
+        self._sim_accum = min(self._sim_accum - n_steps * self.dt, self._max_substeps * self.dt)
+
+    def _on_draw_tick(self):
+        if not self.running:
+            # paused, stopped or impacted: draw one full (non-live) frame of the final state, even
+            # if the last step was already shown, then idle until the next start
+            self.draw_timer.stop()
+            self._draw_scene()
+        elif self._dirty:
+            self._draw_scene()
+
     def _on_reset(self):
-        angle = math.radians(5.0)
-        q0 = np.array([math.cos(angle/2), 0.0, math.sin(angle/2), 0.0])
-        self.state = np.zeros(14)
-        self.state[6:10] = q0
+        # reuse the state array; the reset quaternion is a precomputed unit constant
+        np.copyto(self.state, _STATE_TEMPLATE)
+        self.state[6:10] = _Q0_PITCH5
         self.state[13] = self.sim.mass0
-        self.pos_hist = [self.state[0:3].copy()]
-        # reset all sliders to defaults
+        self._trail_clear()
+        # reset all sliders to defaults (signals blocked; labels refreshed once, scene drawn below)
+        blockers = [QtCore.QSignalBlocker(s) for s in (self.gx_slider, self.gy_slider, self.throttle_slider)]
         self.gx_slider.setValue(0)
         self.gy_slider.setValue(0)
         self.throttle_slider.setValue(100)
+        for b in blockers:
+            b.unblock()
+        self._update_slider_labels()
         self.trail_slider.setValue(1000)
         # reset run log state and stage events BEFORE drawing
-        self.run_log_states = []
-        self.run_log_times = []
+        self._log_clear()
         self.stage_events = []
         # reset flight statistics
         self.max_altitude = 0.0
@@ -563,6 +983,15 @@ class TVCMainWindow(QtWidgets.QMainWindow):
         self.prev_pos = self.state[0:3].copy()
         self.view_btn.setEnabled(False)
         self.run_finished = False
+        # full axes clear only happens here; cached artists are rebuilt on the next draw
+        if not USE_GL_VIEWPORT:
+            self.canvas.ax.cla()
+        # cla() restored the default locators and grid
+        self._live_render = False
+        self._artists = {}
+        self._frame_artists = []
+        self._legend = None
+        self._invalidate_bg()
         self._draw_scene()  # draw after clearing everything
 
     def _on_stage(self):
@@ -572,7 +1001,7 @@ class TVCMainWindow(QtWidgets.QMainWindow):
         # record stage event (time, position)
         t = self.run_log_times[-1] if len(self.run_log_times) > 0 else 0.0
         self.stage_events.append((t, self.state[0:3].copy()))
-        self.status_box.append(f'Stage separation at t={t:.2f}s pos={self.state[0:3]}')
+        self._post_status(f'Stage separation at t={t:.2f}s pos={self.state[0:3]}')
         self._draw_scene()
 
     def _on_canvas_click(self, event):
@@ -580,7 +1009,8 @@ class TVCMainWindow(QtWidgets.QMainWindow):
         try:
             if event.dblclick:
                 self.user_zoom = 1.0
-                self.status_box.append('Zoom reset')
+                self._post_status('Zoom reset')
+                self._invalidate_bg()
                 self._draw_scene()
         except Exception:
             pass
@@ -598,7 +1028,8 @@ class TVCMainWindow(QtWidgets.QMainWindow):
             factor = 0.9 if step > 0 else 1.1
             self.user_zoom *= factor
             self.user_zoom = max(self.zoom_min, min(self.zoom_max, self.user_zoom))
-            self.status_box.append(f'Zoom: {self.user_zoom:.2f}x')
+            self._post_status(f'Zoom: {self.user_zoom:.2f}x')
+            self._invalidate_bg()
             self._draw_scene()
         except Exception:
             pass
@@ -613,32 +1044,28 @@ class TVCMainWindow(QtWidgets.QMainWindow):
             return
         # export full run log if available
         try:
-            with open(fname, 'w', newline='') as f:
-                w = csv.writer(f)
-                w.writerow(['t','x','y','z','vx','vy','vz','qx','qy','qz','qw','mass'])
-                if len(self.run_log_times) > 0 and len(self.run_log_states) == len(self.run_log_times):
-                    for tt, st in zip(self.run_log_times, self.run_log_states):
-                        row = [tt, *st[0:3].tolist(), *st[3:6].tolist(), *st[6:10].tolist(), st[13]]
-                        w.writerow(row)
-                else:
-                    # fallback: write current state only
-                    w.writerow([0.0, *self.state[0:3].tolist(), *self.state[3:6].tolist(), *self.state[6:10].tolist(), self.state[13]])
-            self.status_box.append(f'✓ Exported {len(self.run_log_times)} datapoints to {fname}')
+            if len(self.run_log_times) > 0:
+                data = self._run_log_table()
+            else:
+                # fallback: write current state only
+                data = np.concatenate([[0.0], self.state[0:10], self.state[13:14]])[None, :]
+            np.savetxt(fname, data, fmt='%.15g', delimiter=',', header=','.join(_LOG_COLUMNS), comments='')
+            self._post_status(f'✓ Exported {len(self.run_log_times)} datapoints to {fname}')
         except Exception as e:
-            self.status_box.append(f'✗ Export failed: {e}')
+            self._post_status(f'✗ Export failed: {e}')
 
     def _on_playback(self):
         # toggle playback of recorded run
         if len(self.run_log_states) == 0:
-            self.status_box.append('No recorded run to play back')
+            self._post_status('No recorded run to play back')
             return
         if self.playback_running:
             self.playback_running = False
             self.playback_timer.stop()
             self.playback_btn.setText('Play Log')
             # restore main timer if it was running
-            if getattr(self, 'was_running', False):
-                self.timer.start()
+            if self.was_running:
+                self._start_sim_timer()
                 self.running = True
                 self.start_btn.setText('Pause')
         else:
@@ -660,16 +1087,19 @@ class TVCMainWindow(QtWidgets.QMainWindow):
             self.timer.stop()
         self.running = False
         self.start_btn.setText('Start')
+        self.draw_timer.stop()
+        self._set_live_render(False)
+        self._draw_scene()
         self.run_finished = True
         # enable view button if we have data
         if len(self.run_log_states) > 0:
             self.view_btn.setEnabled(True)
-        self.status_box.append('Run stopped. You can view recorded data.')
+        self._post_status('Run stopped. You can view recorded data.')
 
     def _show_run_data(self):
         # show recorded run in a dialog with table and export button
         if len(self.run_log_states) == 0:
-            self.status_box.append('No run data available')
+            self._post_status('No run data available')
             return
         dlg = QtWidgets.QDialog(self)
         dlg.setWindowTitle('Run Data')
@@ -677,16 +1107,25 @@ class TVCMainWindow(QtWidgets.QMainWindow):
         v = QtWidgets.QVBoxLayout(dlg)
         table = QtWidgets.QTableWidget(dlg)
         n = len(self.run_log_states)
-        cols = ['t','x','y','z','vx','vy','vz','qx','qy','qz','qw','mass']
+        cols = _LOG_COLUMNS
         table.setColumnCount(len(cols))
         table.setRowCount(n)
         table.setHorizontalHeaderLabels(cols)
-        for i, st in enumerate(self.run_log_states):
-            t = self.run_log_times[i] if i < len(self.run_log_times) else 0.0
-            vals = [t, *st[0:3].tolist(), *st[3:6].tolist(), *st[6:10].tolist(), st[13]]
-            for j, val in enumerate(vals):
-                it = QtWidgets.QTableWidgetItem(f"{val:.6g}")
-                table.setItem(i, j, it)
+        # format every cell in one vectorized call, then fill with updates and signals off
+        # so the table lays out once instead of per item
+        strs = np.char.mod('%.6g', self._run_log_table())
+        table.setUpdatesEnabled(False)
+        table.blockSignals(True)
+        for i in range(n):
+            row = strs[i]
+            for j in range(len(cols)):
+                table.setItem(i, j, QtWidgets.QTableWidgetItem(row[j]))
+        table.blockSignals(False)
+        table.setUpdatesEnabled(True)
+        # size columns from a sample of rows rather than scanning the whole log
+        header = table.horizontalHeader()
+        header.setSectionResizeMode(QtWidgets.QHeaderView.Interactive)
+        header.setResizeContentsPrecision(64)
         table.resizeColumnsToContents()
         v.addWidget(table)
         h = QtWidgets.QHBoxLayout()
@@ -702,16 +1141,11 @@ class TVCMainWindow(QtWidgets.QMainWindow):
         if not fname:
             return
         try:
-            with open(fname, 'w', newline='') as f:
-                w = csv.writer(f)
-                w.writerow(cols)
-                for i, st in enumerate(self.run_log_states):
-                    t = self.run_log_times[i] if i < len(self.run_log_times) else 0.0
-                    row = [t, *st[0:3].tolist(), *st[3:6].tolist(), *st[6:10].tolist(), st[13]]
-                    w.writerow(row)
-            self.status_box.append(f'Exported run CSV to {fname}')
+            # whole log in one savetxt call, same format as the main Export button
+            np.savetxt(fname, self._run_log_table(), fmt='%.15g', delimiter=',', header=','.join(cols), comments='')
+            self._post_status(f'Exported run CSV to {fname}')
         except Exception as e:
-            self.status_box.append(f'Export failed: {e}')
+            self._post_status(f'Export failed: {e}')
 
     def _on_theme_slider(self, val: int):
         mode = 'dark' if val == 1 else 'light'
@@ -724,28 +1158,72 @@ class TVCMainWindow(QtWidgets.QMainWindow):
             self.playback_running = False
             self.playback_timer.stop()
             self.playback_btn.setText('Play Log')
-            self.status_box.append('Playback finished')
+            self._post_status('Playback finished')
             # restore main timer if it was running
-            if getattr(self, 'was_running', False):
-                self.timer.start()
+            if self.was_running:
+                self._start_sim_timer()
                 self.running = True
                 self.start_btn.setText('Pause')
             return
         st = self.run_log_states[self.playback_index]
         self.state = st.copy()
-        # build pos_hist for visualization up to current playback index
-        start_idx = max(0, self.playback_index - (self.trail_slider.value() if hasattr(self, 'trail_slider') else 1000))
-        self.pos_hist = [s[0:3].copy() for s in self.run_log_states[start_idx:self.playback_index+1]]
+        # rebuild the trail for visualization up to current playback index
+        start_idx = max(0, self.playback_index - self.trail_slider.value())
+        self._trail_head = 0
+        self._trail_len = 0
+        self._trail_extend(self.run_log_states[start_idx:self.playback_index+1, 0:3])
         self.playback_index += 1
         self._draw_scene()
 
-    def _update_slider_labels(self):
-        # update displayed numeric labels next to sliders
-        self.gx_val.setText(f"{self.gx_slider.value()/10.0:.1f}°")
-        self.gy_val.setText(f"{self.gy_slider.value()/10.0:.1f}°")
-        self.thr_val.setText(f"{self.throttle_slider.value()}%")
+    def _trail_clear(self):
+        # restart the flight path at the current position
+        self._trail_head = 0
+        self._trail_len = 0
+        self._trail_push(self.state[0:3])
+
+    def _trail_push(self, p):
+        # O(1) append into the ring buffer; the oldest point is overwritten once full
+        n_max = self._trail_buf.shape[0]
+        self._trail_buf[self._trail_head] = p
+        self._trail_head = (self._trail_head + 1) % n_max
+        self._trail_len = min(self._trail_len + 1, n_max)
+
+    def _trail_extend(self, pts):
+        # append (k, 3) points in one scatter into the ring; only the newest n_max can survive
+        n_max = self._trail_buf.shape[0]
+        pts = pts[-n_max:]
+        k = pts.shape[0]
+        self._trail_buf[(self._trail_head + np.arange(k)) % n_max] = pts
+        self._trail_head = (self._trail_head + k) % n_max
+        self._trail_len = min(self._trail_len + k, n_max)
+
+    def _trail_view(self):
+        # flight path ordered oldest -> newest, limited to the trail slider length.
+        # Returns a view of the buffer unless the requested span wraps around.
+        n_max = self._trail_buf.shape[0]
+        n = min(self._trail_len, self.trail_slider.value())
+        start = (self._trail_head - n) % n_max
+        if start + n <= n_max:
+            return self._trail_buf[start:start + n]
+        return np.roll(self._trail_buf, -self._trail_head, axis=0)[n_max - n:]
+
+    def _schedule_redraw(self, *args):
+        # (re)start the debounce window; takes no interval so valueChanged(int) can't set one
+        self._redraw_timer.start()
 
-    def _step_sim(self):
+    def _update_slider_labels(self):
+        # update displayed numeric labels next to sliders, touching only the ones that changed
+        gx, gy, thr = vals = (self.gx_slider.value(), self.gy_slider.value(), self.throttle_slider.value())
+        last = self._last_labels
+        if gx != last[0]:
+            self.gx_val.setText(_GIMBAL_LABELS[gx + 600])
+        if gy != last[1]:
+            self.gy_val.setText(_GIMBAL_LABELS[gy + 600])
+        if thr != last[2]:
+            self.thr_val.setText(f"{thr}%")
+        self._last_labels = vals
+
+    def _step_sim(self, n_steps=1):
         # use captured gimbal and throttle settings (set when Start was pressed)
         gx = self.run_gimbal_x
         gy = self.run_gimbal_y
@@ -753,68 +1231,136 @@ class TVCMainWindow(QtWidgets.QMainWindow):
         
         # apply throttle relative to base thrust; maintain minimum thrust (20%) for gimbal authority
         if self.sim.T != 0:
-            # store base_T if missing
-            if not hasattr(self, 'base_T'):
-                self.base_T = self.sim.T
             # clamp throttle to minimum 20% to maintain gimbal control
             throttle_clamped = max(0.2, throttle)
             self.sim.T = self.base_T * throttle_clamped
         
-        # integrate
-        self.state = self.sim.rk4_step(self.state, np.array([gx, gy]), self.dt)
-        
-        # update flight statistics
-        current_alt = self.state[2]
-        current_vel = np.linalg.norm(self.state[3:6])
-        self.max_altitude = max(self.max_altitude, current_alt)
-        self.max_velocity = max(self.max_velocity, current_vel)
-        
-        # track total distance traveled
-        current_pos = self.state[0:3]
-        distance_step = np.linalg.norm(current_pos - self.prev_pos)
-        self.total_distance += distance_step
-        self.prev_pos = current_pos.copy()
-        
-        # ground collision detection
-        if current_alt <= 0.1 and current_vel > 5.0:
-            # hard impact
+        # integrate n_steps in one kernel call (JIT when numba is available). The kernel writes
+        # each state straight into the run log and tracks the flight statistics and ground contact.
+        self._log_reserve(n_steps)
+        n0 = self._log_n
+        out = self._log_s[n0:n0 + n_steps]
+        s = self.state
+        if self.sim.T == 0 and s[2] == 0.0 and not s[3:6].any() and not s[10:13].any():
+            # engine off, at rest on the ground and not spinning: the ground clamp cancels gravity
+            # and nothing else applies a force or torque, so position, velocity and attitude stay
+            # put and only the mass keeps draining at the constant mdot. Log that directly and
+            # skip the integration.
+            out[:] = s
+            m = out[:, 13]
+            m.fill(self.dt * self.sim.mdot)
+            m[0] += s[13]
+            np.cumsum(m, out=m)
+            self.max_altitude = max(self.max_altitude, 0.0)
+            self.total_distance += _norm3(s[0:3] - self.prev_pos)
+            self.prev_pos[:] = s[0:3]
+            self.state = out[-1].copy()
+            k, impact = n_steps, False
+        else:
+            stats = np.array([self.max_altitude, self.max_velocity, self.total_distance])
+            k, impact = advance_nb(self.state, gx, gy, self.dt, out, self.prev_pos, stats, *self.sim.kernel_params())
+            self.max_altitude, self.max_velocity, self.total_distance = stats
+            self.state = out[k - 1].copy()
+
+        # log times continue from the last row: t0 + dt, t0 + 2dt, ...
+        tt = self._log_t[n0:n0 + k]
+        tt.fill(self.dt)
+        if n0 > self._log_lo:
+            tt[0] += self._log_t[n0 - 1]
+        np.cumsum(tt, out=tt)
+        self._log_n = n0 + k
+        # record flight path
+        self._trail_extend(out[:k, 0:3])
+        if impact:
+            # hard ground impact
+            current_alt = self.state[2]
+            current_vel = _norm3(self.state[3:6])
             self.running = False
             self.timer.stop()
             self.start_btn.setText('Start')
-            self.status_box.append(f'💥 IMPACT! Altitude: {current_alt:.2f}m, Velocity: {current_vel:.2f}m/s')
-            self.status_box.append('Tip: Try gentler gimbal angles for softer landings')
-        elif current_alt <= 0.0:
-            # soft landing or stopped
-            self.state[2] = 0.0  # clamp to ground
-            self.state[3:6] = np.zeros(3)  # stop velocity
-        
-        # record flight path and full state
-        self.pos_hist.append(self.state[0:3].copy())
-        self.run_log_states.append(self.state.copy())
-        t = self.run_log_times[-1] + self.dt if len(self.run_log_times) > 0 else self.dt
-        self.run_log_times.append(t)
-        # trim history according to trail length
-        maxp = self.trail_slider.value() if hasattr(self, 'trail_slider') else 1000
-        if len(self.pos_hist) > maxp:
-            self.pos_hist = self.pos_hist[-maxp:]
-        if len(self.run_log_states) > maxp*4:
-            self.run_log_states = self.run_log_states[-maxp*4:]
+            self._post_status(f'💥 IMPACT! Altitude: {current_alt:.2f}m, Velocity: {current_vel:.2f}m/s')
+            self._post_status('Tip: Try gentler gimbal angles for softer landings')
+
+        # trim run log according to trail length (the trail ring buffer wraps on its own)
+        maxp = self.trail_slider.value()
+        self._log_lo = max(self._log_lo, self._log_n - maxp*4)
+        self._dirty = True
+
+    @property
+    def run_log_states(self):
+        # (n, 14) view of the recorded states
+        return self._log_s[self._log_lo:self._log_n]
+
+    @property
+    def run_log_times(self):
+        return self._log_t[self._log_lo:self._log_n]
+
+    def _run_log_table(self):
+        # (n, 12) block matching the CSV/table columns t, pos, vel, quat, mass
+        states = self.run_log_states
+        return np.column_stack([self.run_log_times, states[:, 0:10], states[:, 13]])
+
+    def _log_clear(self):
+        self._log_lo = 0
+        self._log_n = 0
+
+    def _log_reserve(self, n):
+        # make room for n more rows after _log_n
+        if self._log_n + n > self._log_cap:
+            k = self._log_n - self._log_lo
+            if k > self._log_cap // 2 or k + n > self._log_cap:
+                # live window fills most of the buffer: double capacity
+                while k + n > self._log_cap // 2:
+                    self._log_cap *= 2
+                s = np.empty((self._log_cap, 14))
+                tt = np.empty(self._log_cap)
+                s[:k] = self._log_s[self._log_lo:self._log_n]
+                tt[:k] = self._log_t[self._log_lo:self._log_n]
+                self._log_s, self._log_t = s, tt
+            else:
+                # mostly trimmed rows: slide the live window back to the start
+                self._log_s[:k] = self._log_s[self._log_lo:self._log_n]
+                self._log_t[:k] = self._log_t[self._log_lo:self._log_n]
+            self._log_lo, self._log_n = 0, k
 
     def _draw_scene(self):
+        self._dirty = False
+        if USE_GL_VIEWPORT:
+            self._draw_scene_gl()
+            return
         ax = self.canvas.ax
-        ax.cla()
+        # drop last frame's transient artists; cached ones in self._artists are updated in place
+        for art in self._frame_artists:
+            try:
+                art.remove()
+            except Exception:
+                pass
+        self._frame_artists = []
+        keep = self._keep_frame_artist
         pos = self.state[0:3]
-        # oriented body axes (precompute for vehicle glyph)
-        body_x = quat_rotate(self.state[6:10], np.array([1.0,0.0,0.0]))
-        body_y = quat_rotate(self.state[6:10], np.array([0.0,1.0,0.0]))
-        body_z = quat_rotate(self.state[6:10], np.array([0.0,0.0,1.0]))
+        # float32 render mirror of the position; trail maths stays in float32 like the trail buffer
+        pos32 = pos.astype(np.float32)
+        # flight path (a view of the trail buffer) and the half-width that fits it around the
+        # vehicle, shared by the ground, trajectory and camera blocks below
+        allpos = self._trail_view()
+        path_win = max(6.0, np.max(np.abs(allpos - pos32)) + 1.0) if allpos.size > 0 else 6.0
+        # oriented body axes (precompute for vehicle glyph): one rotation matrix per attitude,
+        # whose columns are the body axes in the inertial frame
+        R = self._attitude()
+        body_x, body_y, body_z = R[:, 0], R[:, 1], R[:, 2]
         scale = 1.0
-        # choose text color consistent with theme
-        is_dark = True if getattr(self, 'theme_slider', None) and self.theme_slider.value() == 1 else False
-        text_color = '#e6eef8' if is_dark else '#5a3a1a'
+        # choose text color consistent with theme (resolved once per theme change)
+        if self._theme_cache is None:
+            self._set_theme_colors('dark' if self.theme_slider.value() == 1 else 'light')
+        tc = self._theme_cache
+        text_color = tc['text_color']
         ax.set_xlabel('x (m)', color=text_color, fontsize=10); ax.set_ylabel('y (m)', color=text_color, fontsize=10); ax.set_zlabel('z (m)', color=text_color, fontsize=10)
-        grid_color = '#333' if is_dark else '#e6d9cc'
-        ax.grid(True, color=grid_color, linewidth=0.3, alpha=0.5)
+        grid_color = tc['grid_color']
+        self._set_live_render(self.running)
+        if self._live_render:
+            ax.grid(False)
+        else:
+            ax.grid(True, color=grid_color, linewidth=0.3, alpha=0.5)
         # tick label colors
         try:
             ax.xaxis.set_tick_params(colors=text_color, labelcolor=text_color)
@@ -824,8 +1370,7 @@ class TVCMainWindow(QtWidgets.QMainWindow):
             pass
         # set pane colors to match background tint (subtle)
         try:
-            bg = '#121418' if is_dark else '#ffffff'
-            pane_rgba = _hex_to_rgba(bg, 0.02 if is_dark else 1.0)
+            pane_rgba = tc['pane_rgba']
             ax.w_xaxis.set_pane_color(pane_rgba)
             ax.w_yaxis.set_pane_color(pane_rgba)
             ax.w_zaxis.set_pane_color(pane_rgba)
@@ -833,196 +1378,123 @@ class TVCMainWindow(QtWidgets.QMainWindow):
             pass
         # draw ground plane centered under current view
         try:
-            allpos = np.array(self.pos_hist)
+            ground = self._artists.get('ground')
+            if ground is None:
+                ground = self._build_ground(ax)
+                self._artists['ground'] = ground
+            for art in self._flatten_artists(ground):
+                art.set_visible(allpos.size > 0)
             if allpos.size > 0:
                 cx, cy, cz = pos
                 # base window expands with the path extent
-                win = max(6.0, np.max(np.abs(allpos - pos)) + 1.0)
+                win = path_win
                 # apply user zoom (mouse wheel)
-                if hasattr(self, 'user_zoom'):
-                    win *= self.user_zoom
-                # create a modest grid for ground plane at z=0
-                g = np.linspace(cx - win, cx + win, 2)
-                X, Y = np.meshgrid(g, g)
-                Z = np.zeros_like(X)
-                ax.plot_surface(X, Y, Z, color=(0.92,0.92,0.92), alpha=0.6, linewidth=0, shade=False)
-                # concentric distance markers on ground plane to indicate scale
-                thetas = np.linspace(0, 2*math.pi, 120)
-                rings = [win*0.25, win*0.5, win]
-                for idx, r in enumerate(rings):
-                    xs = cx + r * np.cos(thetas)
-                    ys = cy + r * np.sin(thetas)
-                    zs = np.zeros_like(xs)
-                    # make the inner two rings more visible (primary launch radii)
-                    if idx < 2:
-                        ax.plot(xs, ys, zs, color='#ff8a00', lw=1.6, alpha=0.95)
-                        try:
-                            ax.text(cx + r, cy, 0.0, f"{r:.0f} m", color='#ffb86b', fontsize=9, horizontalalignment='left')
-                        except Exception:
-                            pass
-                    else:
-                        ax.plot(xs, ys, zs, color='0.6', lw=0.8, alpha=0.6)
-                        try:
-                            ax.text(cx + r, cy, 0.0, f"{r:.0f} m", color='0.45', fontsize=8, horizontalalignment='left')
-                        except Exception:
-                            pass
-                # lightweight grid lines along x/y for orientation
-                grd = np.linspace(cx - win, cx + win, 9)
-                for gx in grd:
-                    ax.plot([gx, gx], [cy - win, cy + win], [0, 0], color='0.9', lw=0.4)
-                for gy in grd:
-                    ax.plot([cx - win, cx + win], [gy, gy], [0, 0], color='0.9', lw=0.4)
-                # set scale indicator label
-                if hasattr(self, 'scale_label'):
+                win *= self.user_zoom
+                # re-lay out the ground only once the centre or window has moved by more than 5%
+                key = self._ground_key
+                if key is None or abs(win - key[2]) > 0.05 * key[2] or math.hypot(cx - key[0], cy - key[1]) > 0.05 * key[2]:
+                    self._ground_key = (cx, cy, win)
+                    self._layout_ground(ground, cx, cy, win)
+                    # set scale indicator label
                     self.scale_label.setText(f"Scale: {win:.1f} m")
                 # canvas title
                 ax.set_title('Inertial frame (meters)', color=text_color)
-                # compass indicator in axes fraction coords (fixed to corner)
-                try:
-                    ax.annotate('', xy=(0.95, 0.85), xytext=(0.95, 0.75), xycoords='axes fraction', arrowprops=dict(arrowstyle='->', color='k'))
-                    ax.text(0.95, 0.87, 'N', transform=ax.transAxes, ha='center', va='bottom', fontsize=9)
-                except Exception:
-                    pass
         except Exception:
             pass
         # draw flight path
-        allpos = np.array(self.pos_hist)
+        traj = self._artists.get('traj')
+        if traj is None:
+            traj, = ax.plot([], [], [], color=_PAL['traj'], lw=1.5, alpha=0.9, animated=True)
+            self._artists['traj'] = traj
+        markers = self._artists.get('trail_markers')
+        if markers is None:
+            markers = ax.scatter([0.0], [0.0], [0.0], color=_PAL['traj'], s=10, depthshade=False, animated=True)
+            self._artists['trail_markers'] = markers
+        traj.set_visible(allpos.shape[0] > 1)
+        markers.set_visible(allpos.shape[0] > 1)
+        traj.set_antialiased(not self._live_render)
         if allpos.shape[0] > 0:
             n = allpos.shape[0]
             if n > 1:
                 # main trajectory line
-                ax.plot(allpos[:,0], allpos[:,1], allpos[:,2], color='C0', lw=1.5, alpha=0.9)
-                # small faded markers along path to help visual following
-                alphas = np.linspace(0.15, 0.9, n)
-                step = max(1, n // 80)
-                for i in range(0, n, step):
-                    ax.scatter([allpos[i,0]], [allpos[i,1]], [allpos[i,2]], color='C0', alpha=alphas[i], s=10)
-            # draw a clear circular vehicle marker (larger for visibility)
-            try:
-                # marker size scales inversely with zoom so it stays visible
-                z = getattr(self, 'user_zoom', 1.0)
-                msize = max(60, int(120 / max(0.2, z)))
-                ax.scatter([pos[0]], [pos[1]], [pos[2]], color='#ff7f0e', edgecolors='#3a2a10', linewidths=0.8, s=msize, label='Vehicle')
-            except Exception:
-                ax.scatter([pos[0]], [pos[1]], [pos[2]], color='C1', s=80, label='Vehicle')
+                traj.set_data_3d(allpos[:,0], allpos[:,1], allpos[:,2])
+                # small faded markers along path to help visual following: one collection
+                pts, rgba = _trail_markers(allpos)
+                markers._offsets3d = (pts[:, 0], pts[:, 1], pts[:, 2])
+                markers.set_color(rgba)
+        # draw a clear circular vehicle marker (larger for visibility)
+        vehicle = self._artists.get('vehicle')
+        if vehicle is None:
+            vehicle = ax.scatter([pos[0]], [pos[1]], [pos[2]], color=_PAL['veh'], edgecolors=_PAL['veh_edge'], linewidths=0.8, s=120, label='Vehicle', animated=True)
+            self._artists['vehicle'] = vehicle
+        vehicle.set_visible(allpos.shape[0] > 0)
+        vehicle._offsets3d = ([pos[0]], [pos[1]], [pos[2]])
+        # marker size scales inversely with zoom so it stays visible
+        z = self.user_zoom
+        vehicle.set_sizes([max(60, int(120 / max(0.2, z)))])
         # draw oriented body axes with tapered tips
         try:
             axes = [(body_x, (1.0,0.2,0.2,0.9)), (body_y, (0.2,0.9,0.2,0.9)), (body_z, (0.2,0.5,0.9,0.9))]
-            for vec, col in axes:
-                base = pos
-                tip = pos + vec * (0.9 * scale)
-                stem = [base.tolist(), (pos + 0.7*vec*scale).tolist()]
-                ax.plot([p[0] for p in stem], [p[1] for p in stem], [p[2] for p in stem], color=col, lw=2.2)
-                # small triangular cone tip
-                tlen = 0.25 * scale
-                # create two vectors perpendicular to vec for the cone base
-                perp1 = np.cross(vec, np.array([0.0,0.0,1.0]))
-                if np.linalg.norm(perp1) < 1e-6:
-                    perp1 = np.cross(vec, np.array([0.0,1.0,0.0]))
-                perp1 /= np.linalg.norm(perp1)
-                perp2 = np.cross(vec, perp1)
-                base_circle = [tip - vec * tlen + 0.08 * (math.cos(a)*perp1 + math.sin(a)*perp2) for a in (0, 2.09, 4.18)]
-                face = [[tip.tolist(), base_circle[0].tolist(), base_circle[1].tolist()], [tip.tolist(), base_circle[1].tolist(), base_circle[2].tolist()], [tip.tolist(), base_circle[2].tolist(), base_circle[0].tolist()]]
-                cone = Poly3DCollection(face, facecolors=col, linewidths=0.1)
-                ax.add_collection3d(cone)
+            cones = self._artists.get('cones')
+            if cones is None:
+                cones = []
+                for _, col in axes:
+                    cone = Poly3DCollection([], facecolors=col, linewidths=0.1, animated=True)
+                    ax.add_collection3d(cone)
+                    cones.append(cone)
+                self._artists['cones'] = cones
+                stems = Line3DCollection(np.zeros((3, 2, 3)), colors=[col for _, col in axes], linewidths=2.2, animated=True)
+                ax.add_collection3d(stems)
+                self._artists['stems'] = stems
+            # stems from the vehicle along each body axis (the rows of R.T), as (axis, end, xyz)
+            stem_segs = np.empty((3, 2, 3))
+            stem_segs[:, 0] = pos
+            stem_segs[:, 1] = pos + 0.7 * scale * R.T
+            self._artists['stems'].set_segments(stem_segs)
+            # small triangular cone tips: body-frame vertices moved to world in one matmul,
+            # then gathered into (cone, triangle, vertex, xyz)
+            cone_faces = (_CONE_VERTS_LOCAL @ R.T + pos)[_CONE_FACES].reshape(3, 3, 3, 3)
+            for cone, faces in zip(cones, cone_faces):
+                cone.set_verts(faces)
         except Exception:
             # fallback simple lines
-            ax.plot([pos[0], pos[0]+scale*body_x[0]], [pos[1], pos[1]+scale*body_x[1]], [pos[2], pos[2]+scale*body_x[2]], color='r')
-            ax.plot([pos[0], pos[0]+scale*body_y[0]], [pos[1], pos[1]+scale*body_y[1]], [pos[2], pos[2]+scale*body_y[2]], color='g')
-            ax.plot([pos[0], pos[0]+scale*body_z[0]], [pos[1], pos[1]+scale*body_z[1]], [pos[2], pos[2]+scale*body_z[2]], color='b')
+            keep(ax.plot([pos[0], pos[0]+scale*body_x[0]], [pos[1], pos[1]+scale*body_x[1]], [pos[2], pos[2]+scale*body_x[2]], color='r')[0])
+            keep(ax.plot([pos[0], pos[0]+scale*body_y[0]], [pos[1], pos[1]+scale*body_y[1]], [pos[2], pos[2]+scale*body_y[2]], color='g')[0])
+            keep(ax.plot([pos[0], pos[0]+scale*body_z[0]], [pos[1], pos[1]+scale*body_z[1]], [pos[2], pos[2]+scale*body_z[2]], color='b')[0])
         
         # draw predictive thrust vector (based on current gimbal slider settings)
-        if not self.running:  # only show prediction when not running
-            try:
-                # compute thrust direction using CURRENT gimbal slider values (not run_gimbal)
-                gx_pred = math.radians(self.gx_slider.value() / 10.0)
-                gy_pred = math.radians(self.gy_slider.value() / 10.0)
-                # thrust in body frame: [sin(gx)*T, -sin(gy)*T, cos(gx)*cos(gy)*T]
-                tb_pred = np.array([
-                    -math.sin(gx_pred) * self.sim.T,
-                    math.sin(gy_pred) * self.sim.T,
-                    math.cos(gx_pred) * math.cos(gy_pred) * self.sim.T,
-                ])
-                # rotate to inertial frame
-                thrust_pred_inertial = quat_rotate(self.state[6:10], tb_pred)
-                # normalize and scale for visualization
-                thrust_mag = np.linalg.norm(thrust_pred_inertial)
-                if thrust_mag > 1e-6:
-                    thrust_dir = thrust_pred_inertial / thrust_mag
-                    arrow_len = 2.5 * scale
-                    ax.quiver(pos[0], pos[1], pos[2], thrust_dir[0], thrust_dir[1], thrust_dir[2], 
-                             length=arrow_len, color='#ff00ff', linewidth=2.5, alpha=0.7, label='Predicted thrust')
-                    
-                    # draw arc from body_z to thrust direction showing gimbal deflection
-                    gimbal_angle_rad = math.sqrt(gx_pred**2 + gy_pred**2)
-                    gimbal_angle_deg = math.degrees(gimbal_angle_rad)
-                    
-                    # create arc by interpolating from body_z to thrust_dir
-                    num_arc_pts = 50  # more points for smoother curve
-                    arc_radius = 2.0 * scale  # larger radius
-                    arc_pts = []
-                    for i in range(num_arc_pts + 1):
-                        t = i / num_arc_pts
-                        # slerp-like interpolation between body_z and thrust_dir
-                        angle_t = gimbal_angle_rad * t
-                        pt = pos + arc_radius * (math.cos(angle_t) * body_z + math.sin(angle_t) * (np.cross(body_z, thrust_dir) / (np.linalg.norm(np.cross(body_z, thrust_dir)) + 1e-6)))
-                        arc_pts.append(pt)
-                    arc_pts = np.array(arc_pts)
-                    ax.plot(arc_pts[:, 0], arc_pts[:, 1], arc_pts[:, 2], color='#ff00ff', linewidth=4.5, alpha=0.95)  # thicker, more opaque
-                    
-                    # add angle text label at arc midpoint
-                    mid_idx = len(arc_pts) // 2
-                    label_pos = arc_pts[mid_idx]
-                    ax.text(label_pos[0], label_pos[1], label_pos[2], f'{gimbal_angle_deg:.1f}°', 
-                           color='#ff00ff', fontsize=14, weight='bold', ha='center')
-            except Exception:
-                pass
-            except Exception:
-                pass
-        
+        self._update_thrust_preview(pos, R, scale)
+
         # velocity vector for current state
         vel = self.state[3:6]
-        vnorm = np.linalg.norm(vel)
+        vnorm = _norm3(vel)
         if vnorm > 1e-6:
             arrow_len = max(0.5, min(3.0, vnorm * 0.12))
-            ax.quiver(pos[0], pos[1], pos[2], vel[0], vel[1], vel[2], length=arrow_len, color='C2', linewidth=1.5)
-        # legend proxies
-        proxies = [Line2D([0],[0], color='C0', lw=1.5), Line2D([0],[0], marker='o', color='w', markerfacecolor='C1', markersize=8), Line2D([0],[0], color='C2', lw=2)]
-        lg = ax.legend(proxies, ['Flight path', 'Vehicle', 'Velocity'], loc='upper left')
-        try:
-            for txt in lg.get_texts():
-                txt.set_color(text_color)
-            lg.get_frame().set_facecolor('#1b2330' if text_color.startswith('#e6') else '#fff')
-        except Exception:
-            pass
+            keep(ax.quiver(pos[0], pos[1], pos[2], vel[0], vel[1], vel[2], length=arrow_len, color=_PAL['vel'], linewidth=1.5))
+        # legend: built once, restyled only when the theme changes
+        lg = self._legend
+        if lg is None:
+            proxies = [Line2D([0],[0], color=_PAL['traj'], lw=1.5), Line2D([0],[0], marker='o', color='w', markerfacecolor=_PAL['veh'], markersize=8), Line2D([0],[0], color=_PAL['vel'], lw=2)]
+            lg = self._legend = ax.legend(proxies, ['Flight path', 'Vehicle', 'Velocity'], loc='upper left')
+            self._legend_tc = None
+        if self._legend_tc is not tc:
+            self._legend_tc = tc
+            try:
+                for txt in lg.get_texts():
+                    txt.set_color(text_color)
+                lg.get_frame().set_facecolor(tc['legend_bg'])
+            except Exception:
+                pass
 
-        # status text
-        roll,pitch,yaw = quat_to_euler(self.state[6:10])
-        t = self.run_log_times[-1] if len(self.run_log_times) > 0 else 0.0
-        stat = f"t={t:.2f}s  pos=({pos[0]:.1f},{pos[1]:.1f},{pos[2]:.1f})  mass={self.state[13]:.1f} kg\nroll={math.degrees(roll):.1f}° pitch={math.degrees(pitch):.1f}° yaw={math.degrees(yaw):.1f}°"
-        self.status_box.setPlainText(stat)
-
-        # update HUD labels (immediately reflect live state)
-        try:
-            speed = np.linalg.norm(self.state[3:6])
-            alt = pos[2]
-            self.hud_vel.setText(f"Velocity: {speed:.2f} m/s")
-            self.hud_alt.setText(f"Altitude: {alt:.2f} m")
-            self.hud_thr.setText(f"Throttle: {int(self.throttle_slider.value())}%")
-            self.hud_gimb.setText(f"Gimbal X: {self.gx_slider.value()/10.0:.1f}°   Gimbal Y: {self.gy_slider.value()/10.0:.1f}°")
-            self.hud_stats.setText(f"Max Alt: {self.max_altitude:.1f}m | Max Vel: {self.max_velocity:.1f}m/s")
-            self.hud_flight.setText(f"Time: {t:.1f}s | Distance: {self.total_distance:.1f}m")
-        except Exception:
-            pass
+        self._update_hud(pos)
 
         # autoscale camera around current position
         try:
-            allpos = np.array(self.pos_hist)
             if allpos.size > 0:
                 cx, cy, cz = pos
-                win = max(6.0, np.max(np.abs(allpos - pos)) + 1.0)
+                win = path_win
                 # apply top-down/orthographic if requested
-                if getattr(self, 'topdown_chk', None) and self.topdown_chk.isChecked():
+                if self.topdown_chk.isChecked():
                     try:
                         # set orthographic projection if supported
                         if hasattr(ax, 'set_proj_type'):
@@ -1041,137 +1513,368 @@ class TVCMainWindow(QtWidgets.QMainWindow):
                     except Exception:
                         pass
                     # apply camera tracking or auto-center
-                    if getattr(self, 'camera_track_chk', None) and self.camera_track_chk.isChecked():
+                    if self.camera_track_chk.isChecked():
                         # camera always centered on vehicle
                         follow_dist = win * 1.2
                         ax.set_xlim(pos[0] - follow_dist, pos[0] + follow_dist)
                         ax.set_ylim(pos[1] - follow_dist, pos[1] + follow_dist)
                         ax.set_zlim(max(0.0, pos[2] - follow_dist*0.3), pos[2] + follow_dist)
-                    elif getattr(self, 'auto_center_chk', None) and self.auto_center_chk.isChecked():
+                    elif self.auto_center_chk.isChecked():
                         ax.set_xlim(cx - win, cx + win)
                         ax.set_ylim(cy - win, cy + win)
                         ax.set_zlim(max(0.0, cz - win*0.2), cz + win)
-                # draw stage markers (vertical lines) at recorded stage events
-                for ev in self.stage_events:
-                    t_ev, p_ev = ev
-                    ax.plot([p_ev[0], p_ev[0]], [p_ev[1], p_ev[1]], [0.0, max(1.0, cz + win)], color='k', ls='--', lw=1.0)
+                # draw stage markers (vertical lines) at recorded stage events, one segment each
+                stages = self._artists.get('stages')
+                if stages is None:
+                    stages = Line3DCollection(np.zeros((1, 2, 3)), colors='k', linestyles='--', linewidths=1.0, animated=True)
+                    ax.add_collection3d(stages)
+                    self._artists['stages'] = stages
+                stages.set_visible(len(self.stage_events) > 0)
+                if self.stage_events:
+                    stages.set_segments(self._stage_segments(max(1.0, cz + win)))
         except Exception:
             pass
 
-        # optimized draw with anti-aliasing disabled for performance
+        self._present()
+
+    def _draw_scene_gl(self):
+        # OpenGL viewport: push this frame's vertex data into the persistent GL items.
+        # Physics stays float64; everything uploaded as vertices is a float32 mirror.
+        pos = self.state[0:3].astype(np.float32)
+        R = self._attitude().astype(np.float32)
+        trail = self._trail_view()
+        preview = None
+        if not self.running:
+            # predicted thrust arrow, gimbal arc and angle label while paused
+            preview = self._thrust_preview_geometry(pos, self._attitude())
+            if preview is not None:
+                preview = (preview[0].astype(np.float32), preview[1].astype(np.float32), preview[2])
+        vel_segs = None
+        vel = self.state[3:6]
+        vnorm = _norm3(vel)
+        if vnorm > 1e-6:
+            vel_segs = _arrow_segments(pos, vel / vnorm, max(0.5, min(3.0, vnorm * 0.12))).astype(np.float32)
+        win = max(6.0, np.max(np.abs(trail - pos)) + 1.0) if trail.size > 0 else 6.0
+        if trail.size > 0:
+            self.scale_label.setText(f"Scale: {win:.1f} m")
+        stage_segs = self._stage_segments(max(1.0, pos[2] + win)).astype(np.float32) if self.stage_events else None
+        self.canvas.update_scene(pos, R, trail, _CONE_VERTS_LOCAL @ R.T + pos, preview, vel_segs, stage_segs, win,
+                                 follow=self.camera_track_chk.isChecked() or self.auto_center_chk.isChecked(),
+                                 topdown=self.topdown_chk.isChecked(), live=self.running)
+        self._update_hud(pos)
+
+    def _stage_segments(self, top):
+        # one vertical segment from the ground up to z=top at each recorded stage event
+        segs = np.zeros((len(self.stage_events), 2, 3))
+        segs[:, :, :2] = np.array([p_ev[:2] for _, p_ev in self.stage_events])[:, None, :]
+        segs[:, 1, 2] = top
+        return segs
+
+    def _update_hud(self, pos):
+        # while running the HUD refreshes at 10 Hz; the frame drawn on pause brings it up to date
+        if self.running:
+            now = time.perf_counter()
+            if now < self._hud_next:
+                return
+            self._hud_next = now + 0.1
+        # status text
+        roll,pitch,yaw = quat_to_euler(self.state[6:10])
+        t = self.run_log_times[-1] if len(self.run_log_times) > 0 else 0.0
+        stat = f"t={t:.2f}s  pos=({pos[0]:.1f},{pos[1]:.1f},{pos[2]:.1f})  mass={self.state[13]:.1f} kg\nroll={math.degrees(roll):.1f}° pitch={math.degrees(pitch):.1f}° yaw={math.degrees(yaw):.1f}°"
+        self._set_hud_text(self.status_box, stat)
+
+        # update HUD labels (immediately reflect live state)
+        try:
+            speed = _norm3(self.state[3:6])
+            alt = pos[2]
+            self._set_hud_text(self.hud_vel, f"Velocity: {speed:.2f} m/s")
+            self._set_hud_text(self.hud_alt, f"Altitude: {alt:.2f} m")
+            self._set_hud_text(self.hud_thr, f"Throttle: {int(self.throttle_slider.value())}%")
+            self._set_hud_text(self.hud_gimb, f"Gimbal X: {self.gx_slider.value()/10.0:.1f}°   Gimbal Y: {self.gy_slider.value()/10.0:.1f}°")
+            self._set_hud_text(self.hud_stats, f"Max Alt: {self.max_altitude:.1f}m | Max Vel: {self.max_velocity:.1f}m/s")
+            self._set_hud_text(self.hud_flight, f"Time: {t:.1f}s | Distance: {self.total_distance:.1f}m")
+        except Exception:
+            pass
+
+    def _set_hud_text(self, widget, text):
+        # skip the Qt relayout/repaint when the formatted text is unchanged
+        if self._hud_last.get(widget) == text:
+            return
+        self._hud_last[widget] = text
+        if widget is self.status_box:
+            widget.setPlainText(text)
+        else:
+            widget.setText(text)
+
+    def _present(self, preview_only=False):
+        # fast path: view unchanged since the cached background was rendered, so
+        # restore it and redraw only the data artists; otherwise schedule a full draw.
+        # preview_only: just the thrust preview changed, so repaint it over _preview_bg
+        if self._bg is not None and self._view_key() == self._bg_key:
+            if not preview_only:
+                self._blit_full = True
+            # coalesce like draw_idle: several scene updates before the event loop runs blit once
+            if not self._blit_pending:
+                self._blit_pending = True
+                QtCore.QTimer.singleShot(0, self._blit_scene)
+            return
+        self._bg = None
         try:
             self.canvas.draw_idle()
         except Exception:
             self.canvas.draw()
 
-    def _apply_styles(self):
-        # Base style setup — theme-specific details are handled by _apply_theme
-        # Set some default global properties
-        self.setStyleSheet("""
-            QScrollArea { border: none; }
-            QHeaderView::section { padding: 4px; }
-        """)
+    def _draw_arrow_preview(self):
+        # cheap path for gimbal slider moves: only the predicted-thrust overlay and the
+        # HUD gimbal readout depend on the sliders, so leave the rest of the scene alone
+        if 'thrust' not in self._artists:
+            self._draw_scene()
+            return
+        self._set_hud_text(self.hud_gimb, f"Gimbal X: {self.gx_slider.value()/10.0:.1f}°   Gimbal Y: {self.gy_slider.value()/10.0:.1f}°")
+        self._update_thrust_preview(self.state[0:3], self._attitude())
+        self._present(preview_only=True)
+
+    def _update_thrust_preview(self, pos, R, scale=1.0):
+        # predicted thrust arrow, gimbal arc and angle label; shown only while paused
+        ax = self.canvas.ax
+        thrust = self._artists.get('thrust')
+        if thrust is None:
+            thrust = Line3DCollection([[pos, pos]], colors='#ff00ff', linewidths=2.5, alpha=0.7, animated=True)
+            ax.add_collection3d(thrust)
+            arc, = ax.plot([], [], [], color='#ff00ff', linewidth=4.5, alpha=0.95, animated=True)  # thicker, more opaque
+            arc_label = ax.text(0.0, 0.0, 0.0, '', color='#ff00ff', fontsize=14, weight='bold', ha='center', animated=True)
+            self._artists.update(thrust=thrust, arc=arc, arc_label=arc_label)
+        arc = self._artists['arc']
+        arc_label = self._artists['arc_label']
+        for art in (thrust, arc, arc_label):
+            art.set_visible(False)
+        if self.running:  # only show prediction when not running
+            return
+        try:
+            preview = self._thrust_preview_geometry(pos, R, scale)
+            if preview is not None:
+                thrust_segs, arc_pts, label = preview
+                thrust.set_segments(thrust_segs)
+                thrust.set_visible(True)
+                arc.set_data_3d(arc_pts[:, 0], arc_pts[:, 1], arc_pts[:, 2])
+                arc.set_visible(True)
+                # angle text label at arc midpoint
+                arc_label.set_position_3d(arc_pts[len(arc_pts) // 2])
+                arc_label.set_text(label)
+                arc_label.set_visible(True)
+        except Exception:
+            pass
+
+    def _thrust_preview_geometry(self, pos, R, scale=1.0):
+        # predicted thrust arrow segments, gimbal arc points and angle label for the current
+        # gimbal sliders, or None with no thrust (shared by the Matplotlib and GL views)
+        body_z = R[:, 2]
+        # compute thrust direction using CURRENT gimbal slider values (not run_gimbal)
+        gx_pred = math.radians(self.gx_slider.value() / 10.0)
+        gy_pred = math.radians(self.gy_slider.value() / 10.0)
+        thrust_dir = self._predicted_thrust_dir(gx_pred, gy_pred, R)
+        if thrust_dir is None:
+            return None
+        arrow_len = 2.5 * scale
+        thrust_segs = _arrow_segments(pos, thrust_dir, arrow_len)
+
+        # draw arc from body_z to thrust direction showing gimbal deflection
+        gimbal_angle_rad = math.sqrt(gx_pred**2 + gy_pred**2)
+        gimbal_angle_deg = math.degrees(gimbal_angle_rad)
+
+        # create arc by interpolating from body_z to thrust_dir (slerp-like, 51 points
+        # in one broadcast; the swing axis is the same for every point)
+        arc_radius = 2.0 * scale  # larger radius
+        axis = np.cross(body_z, thrust_dir)
+        axis /= _norm3(axis) + 1e-6
+        ts = _ARC_T * gimbal_angle_rad
+        arc_pts = pos + arc_radius * (np.cos(ts)[:, None] * body_z + np.sin(ts)[:, None] * axis)
+        return thrust_segs, arc_pts, f'{gimbal_angle_deg:.1f}°'
+
+    def _attitude(self):
+        # body-to-inertial rotation matrix of the current state, rebuilt only when the quaternion changes
+        q = self.state[6:10]
+        if not np.array_equal(q, self._R_quat):
+            self._R_quat[:] = q
+            self._R = quat_to_mat(q)
+        return self._R
+
+    def _predicted_thrust_dir(self, gx_pred, gy_pred, R):
+        # inertial unit thrust direction for the given gimbal angles and attitude matrix R,
+        # or None with no thrust
+        # thrust in body frame: [sin(gx)*T, -sin(gy)*T, cos(gx)*cos(gy)*T]
+        tb_pred = self._tb_scratch
+        tb_pred[0] = -math.sin(gx_pred) * self.sim.T
+        tb_pred[1] = math.sin(gy_pred) * self.sim.T
+        tb_pred[2] = math.cos(gx_pred) * math.cos(gy_pred) * self.sim.T
+        # rotate to inertial frame
+        thrust_pred_inertial = R @ tb_pred
+        # normalize for visualization
+        thrust_mag = _norm3(thrust_pred_inertial)
+        if thrust_mag > 1e-6:
+            return thrust_pred_inertial / thrust_mag
+        return None
+
+    def _keep_frame_artist(self, art):
+        # register an artist that only lives until the next _draw_scene
+        art.set_animated(True)
+        self._frame_artists.append(art)
+        return art
+
+    def _dynamic_artists(self):
+        return self._frame_artists + self._flatten_artists(self._artists)
+
+    @staticmethod
+    def _flatten_artists(group):
+        # artists held in (nested) dicts and lists, as stored in self._artists
+        arts = []
+        stack = [group]
+        while stack:
+            a = stack.pop()
+            if isinstance(a, dict):
+                stack.extend(a.values())
+            elif isinstance(a, list):
+                stack.extend(a)
+            else:
+                arts.append(a)
+        return arts
+
+    def _build_ground(self, ax):
+        # persistent ground artists; positions are filled in by _layout_ground
+        ground = {
+            'surface': ax.plot_surface(np.zeros((2, 2)), np.zeros((2, 2)), np.zeros((2, 2)), color=(0.92,0.92,0.92), alpha=0.6, linewidth=0, shade=False),
+            # make the inner two rings more visible (primary launch radii)
+            'rings': [ax.plot([], [], [], color=_PAL['ring'], lw=1.6, alpha=0.95)[0],
+                      ax.plot([], [], [], color=_PAL['ring'], lw=1.6, alpha=0.95)[0],
+                      ax.plot([], [], [], color='0.6', lw=0.8, alpha=0.6)[0]],
+            'ring_labels': [ax.text(0.0, 0.0, 0.0, '', color=_PAL['ring_label'], fontsize=9, horizontalalignment='left'),
+                            ax.text(0.0, 0.0, 0.0, '', color=_PAL['ring_label'], fontsize=9, horizontalalignment='left'),
+                            ax.text(0.0, 0.0, 0.0, '', color='0.45', fontsize=8, horizontalalignment='left')],
+            # lightweight grid lines along x/y for orientation
+            'grid': Line3DCollection(np.zeros((18, 2, 3)), colors='0.9', linewidths=0.4),
+            # compass indicator in axes fraction coords (fixed to corner)
+            'compass': [ax.annotate('', xy=(0.95, 0.85), xytext=(0.95, 0.75), xycoords='axes fraction', arrowprops=dict(arrowstyle='->', color='k')),
+                        ax.text2D(0.95, 0.87, 'N', transform=ax.transAxes, ha='center', va='bottom', fontsize=9)],
+        }
+        ax.add_collection3d(ground['grid'])
+        for art in self._flatten_artists(ground):
+            art.set_animated(True)
+        self._ground_key = None
+        return ground
+
+    def _layout_ground(self, ground, cx, cy, win):
+        # ground plane at z=0 (spans cx +- win on both axes, as the meshgrid(g, g) it replaced)
+        x0, x1, y0, y1 = cx - win, cx + win, cy - win, cy + win
+        ground['surface'].set_verts([[(x0, x0, 0.0), (x1, x0, 0.0), (x1, x1, 0.0), (x0, x1, 0.0)]])
+        # concentric distance markers on ground plane to indicate scale
+        for r, ring, label in zip((win*0.25, win*0.5, win), ground['rings'], ground['ring_labels']):
+            ring.set_data_3d(cx + r * _RING_COS, cy + r * _RING_SIN, _RING_ZEROS)
+            label.set_position_3d((cx + r, cy, 0.0))
+            label.set_text(f"{r:.0f} m")
+        # 9 lines along y, then 9 along x, both at the cx +- win stations like the plane above
+        grd = cx + win * _GRID_UNIT
+        segs = np.zeros((18, 2, 3))
+        segs[:9, :, 0] = grd[:, None]
+        segs[:9, 0, 1], segs[:9, 1, 1] = y0, y1
+        segs[9:, 0, 0], segs[9:, 1, 0] = x0, x1
+        segs[9:, :, 1] = grd[:, None]
+        ground['grid'].set_segments(segs)
+
+    def _view_key(self):
+        # everything the cached background depends on
+        ax = self.canvas.ax
+        bbox = self.canvas.figure.bbox
+        return (ax.get_xlim(), ax.get_ylim(), ax.get_zlim(), ax.elev, ax.azim,
+                self.topdown_chk.isChecked(), self.theme_slider.value(), self._live_render, bbox.width, bbox.height)
+
+    def _set_live_render(self, live):
+        # tick and label layout is the bulk of a Matplotlib 3D draw; while the sim runs the
+        # axes drop their ticks (and the grid, see _draw_scene), restored on pause/stop
+        if live == self._live_render:
+            return
+        self._live_render = live
+        axes = (self.canvas.ax.xaxis, self.canvas.ax.yaxis, self.canvas.ax.zaxis)
+        if live:
+            self._saved_locators = tuple(a.get_major_locator() for a in axes)
+            for a in axes:
+                a.set_major_locator(NullLocator())
+        else:
+            for a, loc in zip(axes, self._saved_locators):
+                a.set_major_locator(loc)
+
+    def _invalidate_bg(self, *args):
+        self._bg = None
+
+    def _on_canvas_draw(self, event):
+        # a full render just finished: cache it as the background, then paint the data on top
+        self._bg = self.canvas.copy_from_bbox(self.canvas.figure.bbox)
+        self._bg_key = self._view_key()
+        self._draw_layers()
+
+    def _preview_artists(self):
+        return [self._artists[k] for k in ('thrust', 'arc', 'arc_label') if k in self._artists]
+
+    def _draw_layers(self):
+        # data artists with the thrust preview last; while paused, snapshot the frame
+        # before the preview goes on so slider moves only have to repaint the preview
+        preview = self._preview_artists()
+        self._draw_dynamic([a for a in self._dynamic_artists() if a not in preview])
+        self._preview_bg = None if self.running else self.canvas.copy_from_bbox(self.canvas.figure.bbox)
+        self._draw_dynamic(preview)
+
+    def _draw_dynamic(self, arts):
+        ax = self.canvas.ax
+        arts = [a for a in arts if a.get_visible() and a.axes is ax]
+        # same painter's ordering as Axes3D.draw: project collections/patches and
+        # stack them back-to-front above the axis grid
+        zorder = max(axis.get_zorder() for axis in (ax.xaxis, ax.yaxis, ax.zaxis)) + 1
+        solids = [a for a in arts if isinstance(a, (Collection, Patch))]
+        for a in sorted(solids, key=lambda a: a.do_3d_projection(), reverse=True):
+            a.zorder = zorder
+            zorder += 1
+        for a in sorted(arts, key=lambda a: a.get_zorder()):
+            ax.draw_artist(a)
+
+    def _blit_scene(self):
+        self._blit_pending = False
+        full, self._blit_full = self._blit_full, False
+        if self._bg is None:
+            # background was invalidated after the blit was scheduled
+            self.canvas.draw_idle()
+            return
+        if full or self._preview_bg is None:
+            self.canvas.restore_region(self._bg)
+            self._draw_layers()
+        else:
+            self.canvas.restore_region(self._preview_bg)
+            self._draw_dynamic(self._preview_artists())
+        self.canvas.blit(self.canvas.figure.bbox)
 
     def _on_toggle_theme(self, checked: bool):
         self._apply_theme('dark' if checked else 'light')
 
     def _apply_theme(self, theme: str = 'light'):
-        # theme-aware style adjustments with smooth animation
-        if theme == 'dark':
-            # teal-accent dark theme — flat & sophisticated
-            btn_css = """
-            QPushButton {
-                background: #1a3a52;
-                color: #64b5f6;
-                border: 1px solid rgba(66,165,245,0.3);
-                border-radius: 6px;
-                padding: 10px 14px;
-                font-weight: 600;
-                font-size: 12px;
-            }
-            QPushButton:hover {
-                background: #1f4a66;
-                border: 1px solid rgba(100,181,246,0.5);
-                color: #90caf9;
-            }
-            QPushButton:pressed {
-                background: #0d2435;
-                border: 1px solid rgba(100,181,246,0.6);
-            }
-            QGroupBox { 
-                color: #e6eef8; 
-                font-weight: 700;
-                border: 1px solid rgba(66,165,245,0.15);
-                border-radius: 6px;
-                margin-top: 10px;
-                padding-top: 10px;
-            }
-            QLabel { color: #e6eef8; }
-            QTextEdit { background: #0f1113; color: #e6eef8; border: 1px solid rgba(66,165,245,0.15); }
-            QCheckBox { color: #e6eef8; }
-            QComboBox { color: #e6eef8; background: #1a1a1e; border: 1px solid rgba(66,165,245,0.15); }
-            """
-            sld_css = """
-            QSlider::groove:horizontal { height: 6px; background: #1a1a1e; border-radius: 3px; }
-            QSlider::sub-page:horizontal { background: #42a5f5; border-radius: 3px; }
-            QSlider::handle:horizontal { background: #64b5f6; width: 14px; margin: -4px 0; border-radius: 7px; border: 1px solid rgba(66,165,245,0.4); }
-            QSlider::add-page:horizontal { background: #222; border-radius: 3px; }
-            """
-            base = "QWidget { background: #0f1113; color: #e6eef8; }"
-        else:
-            # light theme: teal accents, flat design
-            btn_css = """
-            QPushButton {
-                background: #d4ecf7;
-                color: #1a4d6d;
-                border: 1px solid rgba(66,165,245,0.3);
-                border-radius: 6px;
-                padding: 10px 14px;
-                font-weight: 600;
-                font-size: 12px;
-            }
-            QPushButton:hover {
-                background: #c5e9f5;
-                border: 1px solid rgba(66,165,245,0.5);
-                color: #0d3d5c;
-            }
-            QPushButton:pressed {
-                background: #81c3f7;
-                border: 1px solid rgba(66,165,245,0.6);
-            }
-            QGroupBox { 
-                color: #1a4d6d; 
-                font-weight: 700;
-                border: 1px solid rgba(66,165,245,0.2);
-                border-radius: 6px;
-                margin-top: 10px;
-                padding-top: 10px;
-            }
-            QLabel { color: #1a4d6d; }
-            QTextEdit { background: #fafbfc; color: #1a4d6d; border: 1px solid rgba(66,165,245,0.2); }
-            QCheckBox { color: #1a4d6d; }
-            QComboBox { color: #1a4d6d; background: #eef7fb; border: 1px solid rgba(66,165,245,0.2); }
-            """
-            sld_css = """
-            QSlider::groove:horizontal { height: 6px; background: #d4e8f3; border-radius: 3px; }
-            QSlider::sub-page:horizontal { background: #2196f3; border-radius: 3px; }
-            QSlider::handle:horizontal { background: #1976d2; width: 14px; margin: -4px 0; border-radius: 7px; border: 1px solid rgba(66,165,245,0.4); }
-            QSlider::add-page:horizontal { background: #e3f2fd; border-radius: 3px; }
-            """
-            base = "QWidget { background: #f5f9fb; color: #1a4d6d; }"
-
+        # theme-aware style adjustments: one sheet on the top-level widget, Qt cascades it
         try:
             # apply with a smooth fade (use setStyleSheet which triggers Qt's internal repaint)
-            self.setStyleSheet(base + btn_css + sld_css)
-            # trigger a gentle repaint animation on child widgets
-            for widget in self.findChildren(QtWidgets.QWidget):
-                try:
-                    widget.update()
-                except Exception:
-                    pass
+            self.setStyleSheet(_DARK_QSS if theme == 'dark' else _LIGHT_QSS)
+            self._set_theme_colors(theme)
         except Exception:
             pass
 
+    def _set_theme_colors(self, theme):
+        # matplotlib scene colors for the theme, read by every _draw_scene
+        dark = theme == 'dark'
+        self._theme_cache = {
+            'text_color': '#e6eef8' if dark else '#5a3a1a',
+            'grid_color': '#333' if dark else '#e6d9cc',
+            'pane_rgba': _PAL['bg'][:3] + (0.02,) if dark else (1.0, 1.0, 1.0, 1.0),
+            'legend_bg': _PAL['legend_bg'] if dark else '#fff',
+            'view_bg': _PAL['bg'] if dark else (1.0, 1.0, 1.0, 1.0),
+        }
+        if USE_GL_VIEWPORT:
+            self.canvas.set_theme(self._theme_cache)
+
 
 def main():
     app = QtWidgets.QApplication(sys.argv)